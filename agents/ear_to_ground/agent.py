@@ -1,38 +1,73 @@
 """Core agent logic for the Ear-to-Ground agent."""
 
-import json
+import asyncio
 import logging
 import os
+import re
+from itertools import chain
 from typing import Dict, List, Any, Literal
 
-from langgraph.graph import MessagesState, StateGraph, END
+from langgraph.graph import StateGraph, END
 from langchain_core.messages import AIMessage, HumanMessage
 from langchain_core.prompts import PromptTemplate
 from langgraph.graph.message import add_messages
-from typing_extensions import Annotated
+from typing_extensions import Annotated, TypedDict
 
+from common import json_utils
 from common.llm import get_llm
 
 logger = logging.getLogger(__name__)
 
-# Node states for the workflow
-NodeState = Literal["SUPERVISOR", "STREAM_TWEETS", "MONITOR_STATUS", "GENERAL_RESPONSE"]
+# Read buffer for loading the tweet dataset (1 MiB)
+_READ_BUFFER_SIZE = 1 << 20
 
+# Intent patterns for supervisor routing (substring match, case-insensitive)
+_STREAM_RE = re.compile(r"stream|start|tweets", re.IGNORECASE)
+_STATUS_RE = re.compile(r"status|monitor", re.IGNORECASE)
 
-class GraphState(MessagesState):
-    """Graph state extending MessagesState."""
+_GENERAL_RESPONSE = (
+    "I'm the Ear-to-Ground monitoring agent. I can stream crisis tweets, "
+    "provide status updates, and monitor social media for PR crises. "
+    "Ask me to 'start streaming' or check 'status'."
+)
+
+# Intents handled by the workflow
+NodeState = Literal["STREAM_TWEETS", "MONITOR_STATUS", "GENERAL_RESPONSE"]
+
+
+class GraphState(TypedDict, total=False):
+    """Graph state as a plain TypedDict (no per-node model validation)."""
     messages: Annotated[list, add_messages]
-    current_action: str = ""
-    streaming_status: str = "idle"
+    current_action: str
+    streaming_status: str
 
 
 class EarToGroundAgent:
     """Core agent for monitoring and streaming crisis-related social media posts."""
     
+    __slots__ = (
+        "_keywords_list",
+        "_load_lock",
+        "_status_response",
+        "_stream_response",
+        "_total_engagement",
+        "_tweets_loaded",
+        "_verified_count",
+        "tweet_file",
+        "tweets",
+        "workflow",
+    )
+    
     def __init__(self):
         self.tweet_file = os.getenv("ORBIT_TWEET_FILE", "data/tweets_astronomer.json")
         self.tweets: List[Dict[str, Any]] = []
-        self._load_tweets()
+        # Aggregate statistics, computed once when tweets are loaded
+        self._total_engagement = 0
+        self._verified_count = 0
+        self._keywords_list: List[str] = []
+        self._build_responses()
+        self._tweets_loaded = False
+        self._load_lock = asyncio.Lock()
         # Build and compile LangGraph workflow
         self.workflow = self._create_workflow().compile()
         
@@ -40,137 +75,153 @@ class EarToGroundAgent:
         """Create the LangGraph workflow for the agent."""
         workflow = StateGraph(GraphState)
         
-        # Add nodes
-        workflow.add_node("supervisor", self._supervisor_node)
-        workflow.add_node("stream_tweets", self._stream_tweets_node) 
-        workflow.add_node("monitor_status", self._monitor_status_node)
-        workflow.add_node("general_response", self._general_response_node)
-        
-        # Set entry point
-        workflow.set_entry_point("supervisor")
-        
-        # Add conditional edges from supervisor
-        workflow.add_conditional_edges(
-            "supervisor",
-            self._route_message,
-            {
-                "stream": "stream_tweets",
-                "status": "monitor_status", 
-                "general": "general_response"
-            }
-        )
-        
-        # All nodes end the workflow
-        workflow.add_edge("stream_tweets", END)
-        workflow.add_edge("monitor_status", END)
-        workflow.add_edge("general_response", END)
+        # Single node: routing and response happen in one super-step
+        workflow.add_node("respond", self._respond_node)
+        workflow.set_entry_point("respond")
+        workflow.add_edge("respond", END)
         
         return workflow
         
     async def ainvoke(self, prompt: str) -> str:
         """Async invoke the agent workflow."""
         try:
-            logger.info(f"EarToGroundAgent.ainvoke called with prompt: {prompt}")
+            logger.info("EarToGroundAgent.ainvoke called with prompt: %s", prompt)
+            # Lazy-load tweets on first use if the server did not preload them
+            if not self._tweets_loaded:
+                await self.aload_tweets()
+            
             state = GraphState(
                 messages=[HumanMessage(content=prompt)],
                 current_action="",
                 streaming_status="active"  # Streaming is handled by server
             )
             
-            logger.info("Calling workflow.ainvoke...")
+            logger.debug("Calling workflow.ainvoke...")
             result = await self.workflow.ainvoke(state)
-            logger.info(f"Workflow result: {result}")
+            logger.debug("Workflow result: %s", result)
             
             # Return the last AI message
             if result["messages"]:
                 last_message = result["messages"][-1]
-                logger.info(f"Last message: {last_message}, type: {type(last_message)}")
+                logger.debug("Last message: %s, type: %s", last_message, type(last_message))
                 if isinstance(last_message, AIMessage):
-                    logger.info(f"AI message content: {last_message.content}")
+                    logger.debug("AI message content: %s", last_message.content)
                     content = last_message.content
                     if content is None:
                         logger.error("AI message content is None!")
                         return "Error: AI message content is None"
                     return content
                 else:
-                    logger.error(f"Last message is not AIMessage: {type(last_message)}")
+                    logger.error("Last message is not AIMessage: %s", type(last_message))
                     
             logger.error("No messages in result")
             return "Unable to process request"
             
         except Exception as e:
-            logger.error(f"Error in agent workflow: {e}")
+            logger.error("Error in agent workflow: %s", e)
             return f"Error processing request: {str(e)}"
             
-    def _supervisor_node(self, state: GraphState) -> GraphState:
-        """Supervisor node that routes messages to appropriate handlers."""
-        logger.info("Processing message in supervisor node")
+    def _respond_node(self, state: GraphState) -> Dict[str, Any]:
+        """Route the latest message by intent and produce the matching response.
+        
+        Compound prompts (e.g. "start streaming and show status") are answered
+        for every detected intent within the same super-step.
+        """
+        logger.debug("Processing message in respond node")
         
         # Get the latest human message
         last_message = state["messages"][-1]
-        user_input = last_message.content.lower()
-        
-        # Determine intent and route
-        if "stream" in user_input or "start" in user_input or "tweets" in user_input:
-            action = "stream"
-        elif "status" in user_input or "monitor" in user_input:
-            action = "status"  
-        else:
-            action = "general"
+        user_input = last_message.content
+        
+        # Determine intents and collect their responses
+        update: Dict[str, Any] = {}
+        responses: List[str] = []
+        actions: List[str] = []
+        if _STREAM_RE.search(user_input):
+            actions.append("stream")
+            responses.append(self._stream_tweets_response())
+            update["streaming_status"] = "active"
+        if _STATUS_RE.search(user_input):
+            actions.append("status")
+            responses.append(self._monitor_status_response())
+        if not actions:
+            actions.append("general")
+            responses.append(self._general_response())
             
-        state["current_action"] = action
-        return state
-        
-    def _route_message(self, state: GraphState) -> str:
-        """Route messages based on supervisor decision."""
-        action = state.get("current_action", "general")
-        logger.info(f"Routing to: {action}")
-        return action
+        logger.info("Routing to: %s", actions)
+        # Return a partial update; the add_messages reducer appends the message
+        update["current_action"] = actions[0]
+        update["messages"] = [AIMessage(content=" ".join(responses))]
+        return update
         
-    def _stream_tweets_node(self, state: GraphState) -> GraphState:
+    def _stream_tweets_response(self) -> str:
         """Handle tweet streaming requests."""
-        response_content = f"Initiating tweet streaming from {len(self.tweets)} crisis tweets. " \
-                          f"Monitoring {self.tweet_file} for social media activity."
+        return self._stream_response
         
-        state["messages"].append(AIMessage(content=response_content))
-        state["streaming_status"] = "active"
-        return state
-        
-    def _monitor_status_node(self, state: GraphState) -> GraphState:
+    def _monitor_status_response(self) -> str:
         """Handle status monitoring requests."""
-        summary = self.get_tweet_summary()
-        response_content = f"Crisis monitoring status: {summary['total_tweets']} tweets loaded, " \
-                          f"{summary['total_engagement']} total engagement, " \
-                          f"streaming status: {self._get_streaming_status()}"
-                          
-        state["messages"].append(AIMessage(content=response_content))
-        return state
-        
-    def _general_response_node(self, state: GraphState) -> GraphState:
+        return self._status_response
+        
+    def _general_response(self) -> str:
         """Handle general queries about the monitoring system."""
-        response_content = "I'm the Ear-to-Ground monitoring agent. I can stream crisis tweets, " \
-                          "provide status updates, and monitor social media for PR crises. " \
-                          "Ask me to 'start streaming' or check 'status'."
-                          
-        state["messages"].append(AIMessage(content=response_content))
-        return state
+        return _GENERAL_RESPONSE
+        
+    def _build_responses(self) -> None:
+        """Pre-render the response strings that only depend on the loaded tweets."""
+        summary = self.get_tweet_summary()
+        self._stream_response = f"Initiating tweet streaming from {len(self.tweets)} crisis tweets. " \
+                                f"Monitoring {self.tweet_file} for social media activity."
+        self._status_response = f"Crisis monitoring status: {summary['total_tweets']} tweets loaded, " \
+                                f"{summary.get('total_engagement', 0)} total engagement, " \
+                                f"streaming status: {self._get_streaming_status()}"
         
     def _get_streaming_status(self) -> str:
         """Get current streaming status."""
         return "active"  # Streaming is handled by server
         
+    async def aload_tweets(self) -> None:
+        """Load tweets in a worker thread so the event loop is never blocked."""
+        async with self._load_lock:
+            if self._tweets_loaded:
+                return
+            await asyncio.to_thread(self._load_tweets)
+            self._tweets_loaded = True
+            
     def _load_tweets(self) -> None:
         """Load tweets from JSON file."""
         try:
-            with open(self.tweet_file, 'r') as f:
-                self.tweets = json.load(f)
+            # Read the whole file in one large binary read and parse the bytes directly
+            with open(self.tweet_file, 'rb', buffering=_READ_BUFFER_SIZE) as f:
+                data = f.read()
+            self.tweets = json_utils.loads(data)
             logger.info(f"Loaded {len(self.tweets)} tweets from {self.tweet_file}")
         except FileNotFoundError:
             logger.error(f"Tweet file not found: {self.tweet_file}")
             self.tweets = []
-        except json.JSONDecodeError as e:
+        except json_utils.JSONDecodeError as e:
             logger.error(f"Error parsing tweet file: {e}")
             self.tweets = []
+        self._compute_tweet_stats()
+        
+    def _compute_tweet_stats(self) -> None:
+        """Compute aggregate tweet statistics in a single pass over the dataset."""
+        total_engagement = 0
+        verified_count = 0
+        for tweet in self.tweets:
+            get = tweet.get
+            total_engagement += get("retweets", 0) + get("likes", 0) + get("replies", 0)
+            if get("verified", False):
+                verified_count += 1
+                
+        # Flatten all keyword lists into one set in C
+        keywords = set(chain.from_iterable(
+            tweet.get("sentiment_keywords", ()) for tweet in self.tweets
+        ))
+                
+        self._total_engagement = total_engagement
+        self._verified_count = verified_count
+        self._keywords_list = sorted(keywords)
+        self._build_responses()
             
     def get_tweet_count(self) -> int:
         """Get total number of tweets available."""
@@ -182,28 +233,17 @@ class EarToGroundAgent:
         
     def get_crisis_keywords(self) -> List[str]:
         """Extract crisis-related keywords from all tweets."""
-        keywords = set()
-        for tweet in self.tweets:
-            if "sentiment_keywords" in tweet:
-                keywords.update(tweet["sentiment_keywords"])
-        return list(keywords)
+        return list(self._keywords_list)
         
     def get_tweet_summary(self) -> Dict[str, Any]:
         """Get summary statistics of the tweet dataset."""
         if not self.tweets:
             return {"total_tweets": 0}
             
-        total_engagement = sum(
-            tweet.get("retweets", 0) + tweet.get("likes", 0) + tweet.get("replies", 0)
-            for tweet in self.tweets
-        )
-        
-        verified_count = sum(1 for tweet in self.tweets if tweet.get("verified", False))
-        
         return {
             "total_tweets": len(self.tweets),
-            "total_engagement": total_engagement,
-            "verified_authors": verified_count,
-            "unverified_authors": len(self.tweets) - verified_count,
-            "keywords": self.get_crisis_keywords()[:10]  # Top 10 keywords
+            "total_engagement": self._total_engagement,
+            "verified_authors": self._verified_count,
+            "unverified_authors": len(self.tweets) - self._verified_count,
+            "keywords": self._keywords_list[:10]  # Top 10 keywords
         }
\ No newline at end of file
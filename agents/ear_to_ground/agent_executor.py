@@ -23,7 +23,7 @@ from a2a.utils import (
 )
 
 from agents.ear_to_ground.agent import EarToGroundAgent
-from agents.ear_to_ground.card import AGENT_CARD
+from agents.ear_to_ground.card import AGENT_CARD_JSON
 
 logger = logging.getLogger("orbit.ear_to_ground_agent.agent_executor")
 
@@ -33,8 +33,10 @@ class EarToGroundAgentExecutor(AgentExecutor):
     
     def __init__(self):
         self.agent = EarToGroundAgent()
-        self.agent_card = AGENT_CARD.model_dump(mode="json", exclude_none=True)
+        self.agent_card = AGENT_CARD_JSON
         self.streaming_service = None
+        # Static part of the response metadata; copied per request
+        self._metadata_base = {"name": self.agent_card["name"]}
         
     def set_streaming_service(self, streaming_service):
         """Set the streaming service reference for manual triggering."""
@@ -63,6 +65,7 @@ class EarToGroundAgentExecutor(AgentExecutor):
         try:
             # Extract user input using their pattern
             prompt = context.get_user_input()
+            prompt_lc = prompt.lower()
             
             # Create task if needed
             task = context.current_task
@@ -72,17 +75,20 @@ class EarToGroundAgentExecutor(AgentExecutor):
                 event_queue.enqueue_event(task)
             
             # Use LangGraph workflow to process the request
-            logger.info(f"Processing request with prompt: {prompt}")
+            logger.info("Processing request with prompt: %s", prompt)
             agent_response = await self.agent.ainvoke(prompt)
-            logger.info(f"Agent response: {agent_response} (type: {type(agent_response)})")
+            logger.debug("Agent response: %s (type: %s)", agent_response, type(agent_response))
             
             # Handle None response
             if agent_response is None:
                 agent_response = "Error: Agent returned None response"
                 logger.error("Agent ainvoke returned None")
             
+            # Final crisis response, fetched at most once per request
+            final_response = None
+            
             # Check if this is a streaming request and trigger streaming service
-            if self.streaming_service and ("stream" in prompt.lower() or "start" in prompt.lower() or "trigger" in prompt.lower()):
+            if self.streaming_service and any(k in prompt_lc for k in ("stream", "start", "trigger")):
                 logger.info("Triggering crisis streaming workflow...")
                 # Clear any previous final response before starting new crisis
                 self.streaming_service.clear_final_response()
@@ -93,11 +99,11 @@ class EarToGroundAgentExecutor(AgentExecutor):
                     agent_response = f"{agent_response} - Crisis streaming initiated!"
                     logger.info("Crisis streaming task created successfully")
                 except Exception as e:
-                    logger.error(f"Failed to start streaming service: {e}")
+                    logger.error("Failed to start streaming service: %s", e)
                     agent_response = f"{agent_response} - Error starting crisis streaming: {e}"
             
             # Check if this is a status request that should include final response
-            elif "status" in prompt.lower():
+            elif "status" in prompt_lc:
                 if self.streaming_service:
                     final_response = self.streaming_service.get_final_response()
                     if final_response:
@@ -108,7 +114,7 @@ class EarToGroundAgentExecutor(AgentExecutor):
                         agent_response = f"{agent_response} - No final response available yet"
             
             # Create message following Coffee AGNTCY pattern
-            message_metadata = {"name": self.agent_card["name"]}
+            message_metadata = dict(self._metadata_base)
             
             # Always include progress and results from streaming service
             if self.streaming_service:
@@ -116,16 +122,15 @@ class EarToGroundAgentExecutor(AgentExecutor):
                 message_metadata["partial_results"] = self.streaming_service.get_results()
                 
                 # If we have a final response from streaming service, include it
-                if "status" in prompt.lower():
-                    final_response = self.streaming_service.get_final_response()
-                    if final_response:
-                        message_metadata["final_crisis_response"] = final_response
+                if final_response:
+                    message_metadata["final_crisis_response"] = final_response
             
-            message = Message(
-                messageId=str(uuid4()),
+            # Fields are built here from known-good types, so skip Pydantic validation
+            message = Message.model_construct(
+                messageId=uuid4().hex,
                 role=Role.agent,
                 metadata=message_metadata,
-                parts=[Part(TextPart(text=agent_response))]
+                parts=[Part.model_construct(root=TextPart.model_construct(text=str(agent_response)))]
             )
             
             # Enqueue the response using event_queue
@@ -133,7 +138,7 @@ class EarToGroundAgentExecutor(AgentExecutor):
             event_queue.enqueue_event(message)
                     
         except Exception as e:
-            logger.error(f"An error occurred while processing request: {e}")
+            logger.error("An error occurred while processing request: %s", e)
             raise ServerError(error=InternalError()) from e
             
     async def cancel(
@@ -30,4 +30,7 @@ AGENT_CARD = AgentCard(
     capabilities=AgentCapabilities(streaming=True),
     skills=[AGENT_SKILL],
     supportsAuthenticatedExtendedCard=False
-)
\ No newline at end of file
+)
+
+# JSON-mode dump of the card, computed once at import time
+AGENT_CARD_JSON = AGENT_CARD.model_dump(mode="json", exclude_none=True)
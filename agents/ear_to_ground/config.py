@@ -23,5 +23,5 @@ class EarToGroundConfig:
         if self.tweet_rate <= 0:
             raise ValueError(f"Tweet rate must be positive: {self.tweet_rate}")
             
-        if not os.path.exists(self.tweet_file):
-            raise FileNotFoundError(f"Tweet file not found: {self.tweet_file}")
\ No newline at end of file
+        # The tweet file is not stat'ed here: the loaders open it anyway and
+        # already raise/handle FileNotFoundError themselves.
\ No newline at end of file
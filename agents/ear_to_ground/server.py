@@ -1,129 +1,60 @@
 """Server for the Ear-to-Ground agent."""
 
-import asyncio
 import logging
-import os
-import signal
-import sys
 from typing import Optional
-from uvicorn import Config, Server
 
-from a2a.server.request_handlers import DefaultRequestHandler
-from a2a.server.apps import A2AStarletteApplication
-from a2a.server.tasks import InMemoryTaskStore
+from a2a.server.agent_execution import AgentExecutor
 from dotenv import load_dotenv
 
-# SLIM integration imports
-from agntcy_app_sdk.factory import GatewayFactory, TransportTypes
-
 from agents.ear_to_ground.agent_executor import EarToGroundAgentExecutor
 from agents.ear_to_ground.card import AGENT_CARD
 from agents.ear_to_ground.config import EarToGroundConfig
 from agents.ear_to_ground.streaming_service import TweetStreamingService
+from common.agent_server import AgentServer
 
 load_dotenv()
 
 logger = logging.getLogger(__name__)
 
 
-class EarToGroundServer:
+class EarToGroundServer(AgentServer):
     """Server for the Ear-to-Ground agent."""
-    
+
+    agent_name = "Ear-to-Ground"
+    agent_card = AGENT_CARD
+    logger = logger
+    # Streaming is triggered manually rather than at startup
+    ready_message = "Ready for manual crisis triggering..."
+
     def __init__(self, config: Optional[EarToGroundConfig] = None):
-        self.config = config or EarToGroundConfig()
-        self.app = None
-        self.bridge = None
+        super().__init__(config or EarToGroundConfig())
         self.streaming_service = None
-        self._shutdown_event = asyncio.Event()
-        
-    def _setup_signal_handlers(self) -> None:
-        """Setup signal handlers for graceful shutdown."""
-        def signal_handler(signum, _):
-            logger.info(f"Received signal {signum}, initiating graceful shutdown...")
-            self._shutdown_event.set()
-            
-        signal.signal(signal.SIGINT, signal_handler)
-        signal.signal(signal.SIGTERM, signal_handler)
-        
-    async def start(self) -> None:
-        """Start the Ear-to-Ground agent server."""
-        logger.info(f"Starting Ear-to-Ground agent on port {self.config.agent_port}")
-        
-        # Setup signal handlers
-        self._setup_signal_handlers()
-        
+
+    async def _create_agent_executor(self) -> AgentExecutor:
+        """Create the executor wired to the tweet streaming service."""
         # Create streaming service (but don't start it automatically)
         self.streaming_service = TweetStreamingService(None, None)
-        
-        # Create A2A application with streaming service reference
+
+        # Create A2A executor with streaming service reference
         agent_executor = EarToGroundAgentExecutor()
         agent_executor.set_streaming_service(self.streaming_service)
-        
-        request_handler = DefaultRequestHandler(
-            agent_executor=agent_executor,
-            task_store=InMemoryTaskStore()
-        )
-        
-        self.app = A2AStarletteApplication(
-            agent_card=AGENT_CARD,
-            http_handler=request_handler
-        )
-        
-        # Setup SLIM bridge to central server
-        factory = GatewayFactory()
-        slim_endpoint = os.getenv('SLIM_ENDPOINT', 'slim://slim:46357')
-        slim_transport = factory.create_transport(
-            transport=TransportTypes.SLIM.value,
-            endpoint=slim_endpoint
-        )
-        
-        self.bridge = factory.create_bridge(self.app, transport=slim_transport)
-        
-        # Start SLIM bridge (connects to central server)
-        logger.info(f"Connecting to central SLIM server at {slim_endpoint}")
-        await self.bridge.start()
-        
-        # Start HTTP server for Gateway UI compatibility
-        config = Config(
-            app=self.app.build(), 
-            host="0.0.0.0", 
-            port=self.config.agent_port, 
-            loop="asyncio"
-        )
-        userver = Server(config)
-        
-        # Run HTTP server - streaming will be triggered manually
-        logger.info(f"HTTP A2A server started on port {self.config.agent_port}")
-        logger.info(f"SLIM gRPC bridge connected to {slim_endpoint}")
-        logger.info("Ready for manual crisis triggering...")
-        
-        try:
-            await userver.serve()
-        except KeyboardInterrupt:
-            logger.info("Shutting down Ear-to-Ground agent server")
-        except Exception as e:
-            logger.error(f"Error running server: {e}")
-            raise
-            
-    async def _wait_for_shutdown(self) -> None:
-        """Wait for shutdown event."""
-        await self._shutdown_event.wait()
-        logger.info("Shutdown event received")
-        
+
+        # Load tweets off the event loop before serving requests
+        await agent_executor.agent.aload_tweets()
+        return agent_executor
+
     async def _cleanup(self) -> None:
         """Cleanup resources during shutdown."""
         logger.info("Starting cleanup...")
-        
+
+        # Cancels an in-flight stream and waits for it before closing SLIM clients
         if self.streaming_service:
-            self.streaming_service.stop()
-            
+            await self.streaming_service.aclose()
+
         if self.bridge:
             # Bridge cleanup would be handled by the factory if needed
             pass
-            
-        # Give streaming service time to finish current operations
-        await asyncio.sleep(2)
-        
+
         logger.info("Cleanup completed")
 
 
@@ -132,6 +63,6 @@ if __name__ == "__main__":
         level=logging.INFO,
         format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
     )
-    
+
     server = EarToGroundServer()
-    asyncio.run(server.start())
\ No newline at end of file
+    server.run()
@@ -1,34 +1,107 @@
 """Tweet streaming service for crisis management."""
 
 import asyncio
-import json
 import logging
 import os
 import random
-from pathlib import Path
-from typing import Dict, Any, List, Optional
-import aiofiles
+from contextvars import ContextVar
+from dataclasses import dataclass
+from itertools import accumulate
+from typing import Dict, Any, List, Mapping, Optional, Sequence, Set, Tuple
 
-from agents.ear_to_ground.card import AGENT_CARD
-from common.slim_client import call_agent_slim
+from agents.ear_to_ground.card import AGENT_CARD_JSON
+from common import env  # noqa: F401  # loads .env before the settings below are read
+from common import json_utils
+from common.slim_client import get_slim_client
+
+try:
+    import ijson
+except ImportError:  # ijson is optional; large files are then parsed in one go
+    ijson = None
+
+try:
+    import simdjson
+except ImportError:  # pysimdjson is optional; tweets are then fully materialized on load
+    simdjson = None
 
 logger = logging.getLogger("orbit.ear_to_ground_agent.streaming_service")
 
+# Prompt prefixes recognised by the downstream agents' executors
+SENTIMENT_PROMPT_PREFIX = "Please analyze the sentiment of this crisis content: "
+FACT_CHECK_PROMPT_PREFIX = "Please verify the claims in this crisis content: "
+RISK_PROMPT_PREFIX = "Please assess the risk for this crisis with combined analysis: "
+
+# Fields every tweet in the dataset must provide
+REQUIRED_TWEET_FIELDS = frozenset(("id", "author", "text", "timestamp"))
+
+# Concrete types a parsed tweet object can have
+TWEET_OBJECT_TYPES = (dict,) if simdjson is None else (dict, simdjson.Object)
+
+# Errors the installed tweet-file parsers raise for malformed JSON; pysimdjson
+# raises a plain ValueError, and ijson.JSONError is not a ValueError at all
+TWEET_PARSE_ERRORS = (
+    (json_utils.JSONDecodeError,)
+    + (() if simdjson is None else (ValueError,))
+    + (() if ijson is None else (ijson.JSONError,))
+)
+
+# Streaming settings, resolved once at import time
+DEFAULT_TWEET_FILE = os.getenv("ORBIT_TWEET_FILE", "data/tweets_astronomer.json")
+MAX_TWEETS = int(os.getenv("ORBIT_MAX_TWEETS", "1"))  # tweets processed per run
+MAX_INFLIGHT = int(os.getenv("ORBIT_MAX_INFLIGHT", "4"))  # concurrent crisis pipelines
+
+# Agent endpoints for SLIM communication, resolved once at import time
+SENTIMENT_ANALYST_ENDPOINT = os.getenv("SENTIMENT_ANALYST_URL", "slim://sentiment-analyst:50052")
+FACT_CHECKER_ENDPOINT = os.getenv("FACT_CHECKER_URL", "slim://fact-checker:50053")
+RISK_SCORE_ENDPOINT = os.getenv("RISK_SCORE_URL", "slim://risk-score:50054")
+PRESS_SECRETARY_ENDPOINT = os.getenv("PRESS_SECRETARY_URL", "slim://press-secretary:50056")
+
+# Deadline for a single agent call, and for one crisis across all of its calls
+AGENT_CALL_TIMEOUT = 30.0
+CRISIS_TIMEOUT = 120.0
+
+# Agents whose status the current crisis pipeline has set; progress is shared
+# across concurrent crises, so a timed-out crisis only resets its own agents
+_crisis_agents: ContextVar[Optional[Set[str]]] = ContextVar("crisis_agents", default=None)
+
+# Key indexes of the current crisis's agent responses, keyed by id(response);
+# scoped to one pipeline so they are dropped as soon as the crisis finishes
+_crisis_indexes: ContextVar[Optional[Dict[int, Tuple[Any, Dict[str, Any]]]]] = ContextVar(
+    "crisis_indexes", default=None
+)
+
+# Tweet files at least this large are stream-parsed to avoid holding raw bytes and objects at once
+STREAM_PARSE_THRESHOLD = 10 * 1024 * 1024
+
+
+@dataclass(slots=True, frozen=True)
+class CrisisData:
+    """Tweet fields passed through one crisis analysis pipeline."""
+    crisis_id: str
+    text: str
+    author: str
+    timestamp: str
+    source: str = "social_media"
+    platform: str = "twitter"
+
 
 class TweetStreamingService:
     """Service for streaming crisis tweets and coordinating agent responses."""
     
     def __init__(self, tweet_file: Optional[str] = None, tweet_rate: Optional[float] = None):
         # Set default tweet file and rate
-        self.tweet_file = tweet_file or os.getenv("ORBIT_TWEET_FILE", "data/tweets_astronomer.json")
+        self.tweet_file = tweet_file or DEFAULT_TWEET_FILE
         self.tweet_rate = tweet_rate or 2.0  # seconds between tweets
+        self.max_tweets = MAX_TWEETS
+        self.max_inflight = MAX_INFLIGHT
         
         # Internal state
-        self.tweets: List[Dict[str, Any]] = []
+        # A list of dicts, or a lazy simdjson.Array when pysimdjson is installed
+        self.tweets: Sequence[Mapping[str, Any]] = []
         self._is_running = False
         self.final_crisis_response: Optional[Dict[str, Any]] = None  # Store final response
-        # Convert agent card to dict following Coffee AGNTCY pattern
-        self.agent_card = AGENT_CARD.model_dump(mode="json", exclude_none=True)
+        # Agent card dict following Coffee AGNTCY pattern
+        self.agent_card = AGENT_CARD_JSON
         
         # Agent progress tracking
         self.agent_progress: Dict[str, str] = {
@@ -44,23 +117,47 @@ class TweetStreamingService:
         self.agent_results: Dict[str, Dict[str, Any]] = {}
         
         # Agent endpoints for SLIM communication
-        self.sentiment_analyst_endpoint = os.getenv("SENTIMENT_ANALYST_URL", "slim://sentiment-analyst:50052")
-        self.fact_checker_endpoint = os.getenv("FACT_CHECKER_URL", "slim://fact-checker:50053")
-        self.risk_score_endpoint = os.getenv("RISK_SCORE_URL", "slim://risk-score:50054")
-        self.press_secretary_endpoint = os.getenv("PRESS_SECRETARY_URL", "slim://press-secretary:50056")
+        self.sentiment_analyst_endpoint = SENTIMENT_ANALYST_ENDPOINT
+        self.fact_checker_endpoint = FACT_CHECKER_ENDPOINT
+        self.risk_score_endpoint = RISK_SCORE_ENDPOINT
+        self.press_secretary_endpoint = PRESS_SECRETARY_ENDPOINT
+        
+        # Static JSON-RPC envelope shared by every agent request
+        self._rpc_template: Dict[str, Any] = {"jsonrpc": "2.0", "method": "message/send", "id": 1}
+        
+        # Long-lived SLIM client; keeps one warm connection per agent endpoint
+        self._slim_client = get_slim_client()
+        
+        # Task running start(); cancelled by stop() to abort in-flight agent calls
+        self._stream_task: Optional[asyncio.Task] = None
     
     def set_agent_status(self, agent_id: str, status: str) -> None:
         """Set agent status for progress tracking."""
         if agent_id in self.agent_progress:
             self.agent_progress[agent_id] = status
-            logger.info(f"Agent {agent_id} status: {status}")
+            logger.info("Agent %s status: %s", agent_id, status)
+            touched = _crisis_agents.get()
+            if touched is not None:
+                touched.add(agent_id)
         else:
-            logger.warning(f"Unknown agent ID: {agent_id}")
+            logger.warning("Unknown agent ID: %s", agent_id)
+    
+    def _bulk_status(self, updates: Dict[str, str]) -> None:
+        """Set several agent statuses at once with a single log record."""
+        unknown = [agent_id for agent_id in updates if agent_id not in self.agent_progress]
+        if unknown:
+            logger.warning("Unknown agent IDs: %s", unknown)
+            updates = {k: v for k, v in updates.items() if k in self.agent_progress}
+        self.agent_progress.update(updates)
+        logger.info("Agent status update: %s", updates)
+        touched = _crisis_agents.get()
+        if touched is not None:
+            touched.update(updates)
     
     def set_agent_result(self, agent_id: str, result: Dict[str, Any]) -> None:
         """Store agent result data."""
         self.agent_results[agent_id] = result
-        logger.info(f"Agent {agent_id} result stored")
+        logger.debug("Agent %s result stored", agent_id)
     
     def get_progress(self) -> Dict[str, str]:
         """Get current agent progress states."""
@@ -86,106 +183,195 @@ class TweetStreamingService:
         # Reset agents and set ear-to-ground as active
         self.reset_agents()
         self.set_agent_status('ear_to_ground', 'active')
+        self._stream_task = asyncio.current_task()
             
-        # Wait for server to fully initialize
-        await asyncio.sleep(5)
+        # Load tweets and connect to the downstream agents while waiting for
+        # the server to fully initialize
+        load_task = asyncio.create_task(self._load_tweets())
+        warm_up_task = asyncio.create_task(self._warm_up_agents())
+        try:
+            await asyncio.sleep(5)
+        except BaseException:
+            load_task.cancel()
+            warm_up_task.cancel()
+            self._stream_task = None
+            self.set_agent_status('ear_to_ground', 'idle')
+            raise
         
         logger.info("Starting tweet streaming service...")
         self._is_running = True
         
         try:
-            await self._load_tweets()
+            await load_task
+            await warm_up_task
             await self._stream_tweets()
             self.set_agent_status('ear_to_ground', 'complete')
+        except asyncio.CancelledError:
+            logger.info("Tweet streaming cancelled")
+            self.set_agent_status('ear_to_ground', 'idle')
+            raise
         except Exception as e:
-            logger.error(f"Error in tweet streaming service: {e}")
+            logger.error("Error in tweet streaming service: %s", e)
             self.set_agent_status('ear_to_ground', 'error')
             raise
         finally:
+            # A failed load skips awaiting the warm-up; cancel it and collect its
+            # outcome so it never outlives start() (no-ops once it has finished)
+            warm_up_task.cancel()
+            await asyncio.gather(warm_up_task, return_exceptions=True)
             self._is_running = False
+            self._stream_task = None
             
     async def _load_tweets(self) -> None:
         """Load tweets from JSON file asynchronously."""
-        tweet_path = Path(self.tweet_file)
-        
-        if not tweet_path.exists():
-            logger.error(f"Tweet file not found: {self.tweet_file}")
-            raise FileNotFoundError(f"Tweet file not found: {self.tweet_file}")
-            
         try:
-            async with aiofiles.open(tweet_path, 'r', encoding='utf-8') as f:
-                content = await f.read()
-                self.tweets = json.loads(content)
-                
-            logger.info(f"Loaded {len(self.tweets)} tweets for streaming")
+            # One thread hop for open + read + parse instead of per-call aiofiles dispatch
+            self.tweets = await asyncio.to_thread(self._read_tweet_file, self.tweet_file)
+        except FileNotFoundError:
+            # Raised by open() itself; no separate existence check beforehand
+            logger.error("Tweet file not found: %s", self.tweet_file)
+            raise
+        except TWEET_PARSE_ERRORS as e:
+            # Only the read is covered here: validation raises ValueError too
+            logger.error("Error parsing tweet file: %s", e)
+            raise
+        except Exception as e:
+            logger.error("Error loading tweets: %s", e)
+            raise
             
+        logger.info("Loaded %d tweets for streaming", len(self.tweets))
+        
+        try:
             # Validate tweet structure
             self._validate_tweets()
-            
-        except json.JSONDecodeError as e:
-            logger.error(f"Error parsing tweet file: {e}")
-            raise
         except Exception as e:
-            logger.error(f"Error loading tweets: {e}")
+            logger.error("Error loading tweets: %s", e)
             raise
     
+    async def _warm_up_agents(self) -> None:
+        """Open the SLIM client for every downstream agent ahead of the first tweet."""
+        await asyncio.gather(
+            self._slim_client.warm_up(self.sentiment_analyst_endpoint),
+            self._slim_client.warm_up(self.fact_checker_endpoint),
+            self._slim_client.warm_up(self.risk_score_endpoint),
+            self._slim_client.warm_up(self.press_secretary_endpoint),
+        )
+    
+    @staticmethod
+    def _read_tweet_file(tweet_file: str) -> Sequence[Mapping[str, Any]]:
+        """Read and parse the tweet file (blocking; run in a worker thread).
+        
+        Large files are stream-parsed with ijson so the raw document is never
+        held in memory. Otherwise, with pysimdjson the document is kept as a lazy
+        array: validation reads keys in place and only the tweets that are
+        streamed become dicts.
+        """
+        # Binary mode: every parser accepts bytes and skips a separate decode step
+        with open(tweet_file, 'rb') as f:
+            # Checked first so a large file never goes to simdjson, whose
+            # array would keep the whole document alive while streaming
+            if ijson is not None and os.fstat(f.fileno()).st_size >= STREAM_PARSE_THRESHOLD:
+                # Large top-level array: build the list item by item
+                return list(ijson.items(f, 'item', use_float=True))
+                
+            if simdjson is not None:
+                # Fresh parser per load; the returned array keeps it alive
+                return simdjson.Parser().parse(f.read())
+                
+            return json_utils.loads(f.read())
+    
     def _validate_tweets(self) -> None:
         """Validate tweet structure."""
         if not self.tweets:
             raise ValueError("No tweets found in file")
             
-        required_fields = ['id', 'author', 'text', 'timestamp']
         for i, tweet in enumerate(self.tweets):
-            for field in required_fields:
-                if field not in tweet:
-                    raise ValueError(f"Tweet {i} missing required field: {field}")
+            # Exact type check and unrolled membership tests; both work on
+            # dicts and simdjson objects without copying keys
+            if type(tweet) not in TWEET_OBJECT_TYPES:
+                raise ValueError(f"Tweet {i} is not a JSON object")
+            if 'id' not in tweet or 'author' not in tweet or 'text' not in tweet or 'timestamp' not in tweet:
+                missing = REQUIRED_TWEET_FIELDS.difference(tweet.keys())
+                raise ValueError(f"Tweet {i} missing required field: {', '.join(sorted(missing))}")
         
         logger.info("Tweet validation passed")
     
     async def _stream_tweets(self) -> None:
         """Stream tweets and trigger crisis analysis."""
-        logger.info(f"Processing {len(self.tweets)} tweets for crisis analysis...")
-        
-        # Process only the first tweet for now to ensure clean flow
         if not self.tweets:
             logger.warning("No tweets available to process")
             return
             
-        tweet = self.tweets[0]  # Process only the first tweet
-        logger.info(f"Processing single tweet for crisis demo: {tweet.get('id', 'unknown')}")
+        # The demo processes only the first tweet by default to keep a clean flow;
+        # slicing a simdjson array materializes just these tweets as dicts
+        tweets = self.tweets[:self.max_tweets]
+        logger.info("Processing %d of %d tweets for crisis analysis...", len(tweets), len(self.tweets))
         
-        try:
-            await self._publish_tweet(tweet)
-        except Exception as e:
-            logger.error(f"Error processing tweet {tweet.get('id', 'unknown')}: {e}")
-            
-        # Original multi-tweet processing (commented out for now)
-        # for tweet in self.tweets:
-        #     if not self._is_running:
-        #         break
-        #         
-        #     try:
-        #         await self._publish_tweet(tweet)
-        #         
-        #         # Variable delay between tweets (0.8x to 1.5x base rate) 
-        #         delay = self.tweet_rate * random.uniform(0.8, 1.5)
-        #         await asyncio.sleep(delay)
-        #         
-        #     except Exception as e:
-        #         logger.error(f"Error broadcasting tweet {tweet.get('id', 'unknown')}: {e}")
-        #         continue
+        # Producer/consumer: tweets are emitted at the configured cadence into a
+        # bounded queue while up to max_inflight workers run crisis pipelines,
+        # so downstream latency overlaps with the wait for the next tweet
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.max_inflight * 2)
+        
+        async def _worker() -> None:
+            while (tweet := await queue.get()) is not None:
+                if not self._is_running:
+                    continue
+                try:
+                    await self._publish_tweet(tweet)
+                except Exception as e:
+                    logger.error("Error processing tweet %s: %s", tweet.get('id', 'unknown'), e)
+        
+        # Pace against absolute deadlines so time spent blocked on the queue
+        # does not push back every later tweet; the jittered schedule is drawn
+        # up front as offsets from the stream start
+        rate = self.tweet_rate
+        uniform = random.uniform
+        offsets = list(accumulate((rate * uniform(0.8, 1.5) for _ in range(len(tweets) - 1)), initial=0.0))
+        loop = asyncio.get_running_loop()
+        stream_start = loop.time()
+        
+        async with asyncio.TaskGroup() as tg:
+            workers = [tg.create_task(_worker()) for _ in range(min(self.max_inflight, len(tweets)))]
+            for tweet, offset in zip(tweets, offsets):
+                if not self._is_running:
+                    break
+                delay = stream_start + offset - loop.time()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                await queue.put(tweet)
+            for _ in workers:
+                await queue.put(None)
         
         await self._publish_completion()
-        logger.info("Single tweet processing completed successfully")
+        logger.info("Tweet processing completed successfully")
         
     async def _publish_tweet(self, tweet: Dict[str, Any]) -> None:
         """Process a single tweet by calling agents directly via SLIM."""
-        crisis_id = tweet.get("id", "unknown")
+        # Required fields are guaranteed by _validate_tweets
+        crisis_id = tweet["id"]
         
-        logger.info(f"Processing crisis: {crisis_id} from {tweet['author']}")
+        logger.info("Processing crisis: %s from %s", crisis_id, tweet['author'])
         
-        # Call agents directly via SLIM (no SLIM broadcasting)
-        await self._call_agents_directly(tweet, crisis_id)
+        # Call agents directly via SLIM (no SLIM broadcasting); each call has its
+        # own timeout, and the whole chain is capped so one crisis cannot stall a worker
+        touched: Set[str] = set()
+        token = _crisis_agents.set(touched)
+        indexes_token = _crisis_indexes.set({})
+        try:
+            async with asyncio.timeout(CRISIS_TIMEOUT):
+                await self._call_agents_directly(tweet, crisis_id)
+        except TimeoutError:
+            logger.error("Crisis %s analysis exceeded %ss; abandoning it", crisis_id, CRISIS_TIMEOUT)
+            # Only agents this crisis set active; other in-flight crises keep theirs
+            abandoned = {
+                agent_id: 'error' for agent_id in touched
+                if self.agent_progress[agent_id] == 'active'
+            }
+            if abandoned:
+                self._bulk_status(abandoned)
+        finally:
+            _crisis_indexes.reset(indexes_token)
+            _crisis_agents.reset(token)
         
     async def _publish_completion(self) -> None:
         """Log stream completion (no SLIM broadcasting)."""
@@ -194,385 +380,266 @@ class TweetStreamingService:
     async def _call_agents_directly(self, tweet: Dict[str, Any], crisis_id: str) -> None:
         """Call sentiment analyst and fact checker agents directly via SLIM."""
         try:
-            # Prepare crisis data for analysis
-            crisis_data = {
-                "crisis_id": crisis_id,
-                "text": tweet.get("text", ""),
-                "content": tweet.get("text", ""),  # Fallback field name
-                "author": tweet.get("author", ""),
-                "timestamp": tweet.get("timestamp", ""),
-                "source": "social_media",
-                "platform": "twitter"
-            }
-            
-            # Create tasks to call both agents in parallel
-            tasks = []
-            
-            # Call sentiment analyst
-            sentiment_task = asyncio.create_task(
-                self._call_sentiment_analyst(crisis_data)
-            )
-            tasks.append(sentiment_task)
-            
-            # Call fact checker
-            fact_checker_task = asyncio.create_task(
-                self._call_fact_checker(crisis_data)
+            # The first two agents only need the tweet text (validated as present)
+            text = tweet["text"]
+            
+            # Call sentiment analyst and fact checker in parallel. Each call is
+            # bounded by its own SLIM timeout and reports a timeout as an error
+            # dict, so no outer deadline cancels the other call mid-flight
+            async with asyncio.TaskGroup() as tg:
+                # The _call_* methods catch their own errors and return an error
+                # dict, so one failing call never cancels the other
+                sentiment_task = tg.create_task(
+                    self._call_sentiment_analyst(crisis_id, text), name=f"sentiment-{crisis_id}"
+                )
+                fact_checker_task = tg.create_task(
+                    self._call_fact_checker(crisis_id, text), name=f"fact-check-{crisis_id}"
+                )
+                
+            sentiment_result = sentiment_task.result()
+            fact_result = fact_checker_task.result()
+            logger.debug("Sentiment analysis and fact checking calls completed")
+
+            # Risk Score needs both analyses; skip its round-trip when either call failed
+            if "error" in sentiment_result or "error" in fact_result:
+                logger.error(
+                    "Skipping Risk Score for crisis %s - Sentiment error: %s, Fact error: %s",
+                    crisis_id, sentiment_result.get("error"), fact_result.get("error")
+                )
+                return
+
+            # Crisis data for the downstream agents, built only once both calls are back
+            crisis = CrisisData(
+                crisis_id=crisis_id,
+                text=text,
+                author=tweet["author"],
+                timestamp=tweet["timestamp"]
             )
-            tasks.append(fact_checker_task)
             
-            # Wait for both agent calls to complete with 30s timeout
-            try:
-                results = await asyncio.wait_for(
-                    asyncio.gather(*tasks, return_exceptions=True),
-                    timeout=30.0
+            # Start Risk Score first so legal extraction overlaps the in-flight call.
+            # The task group cancels the call if the crisis deadline fires.
+            async with asyncio.TaskGroup() as tg:
+                risk_task = tg.create_task(
+                    self._call_risk_score(crisis, sentiment_result, fact_result)
                 )
                 
-                # Process results and call Risk Score if both succeeded
-                sentiment_result = None
-                fact_result = None
-                
-                for i, result in enumerate(results):
-                    if isinstance(result, Exception):
-                        logger.error(f"Agent call {i} failed: {result}")
-                    else:
-                        logger.info(f"Agent call {i} completed successfully")
-                        # Extract analysis data from successful results
-                        if i == 0:  # Sentiment analyst
-                            sentiment_result = result
-                        elif i == 1:  # Fact checker
-                            fact_result = result
+                # Extract legal counsel data from fact result (fact checker calls legal counsel);
+                # a missing review comes back as {} and means Press Secretary is skipped
+                legal_result = self._extract_analysis_data(fact_result, 'legal_review') or None
                 
-                # Call Risk Score if both analyses completed
-                if sentiment_result is not None and fact_result is not None:
-                    risk_result = await self._call_risk_score(crisis_data, sentiment_result, fact_result)
-                    
-                    # Extract legal counsel data from fact result (fact checker calls legal counsel)
-                    # Use the same recursive extractor as for other analysis data
-                    legal_result = self._extract_analysis_data(fact_result, 'legal_review')
-                    if not legal_result:
-                        logger.debug("Legal review not found in fact checker response, trying alternative extraction")
-                        legal_result = self._extract_legal_counsel_data(fact_result)
-                    
-                    # Call Press Secretary with all data if risk assessment succeeded
-                    if risk_result is not None and legal_result is not None:
-                        press_response = await self._call_press_secretary(crisis_data, sentiment_result, fact_result, risk_result, legal_result)
-                        if press_response:
-                            # Store the final response for retrieval by gateway
-                            logger.info("Storing final Press Secretary response for gateway retrieval")
-                            self.final_crisis_response = press_response
-                            self._display_final_crisis_response(crisis_data, press_response)
-                    else:
-                        logger.error(f"Cannot call Press Secretary - missing data. Risk: {risk_result is not None}, Legal: {legal_result is not None}")
-                else:
-                    logger.error(f"Cannot call Risk Score - missing analysis data. Sentiment: {sentiment_result is not None}, Fact: {fact_result is not None}")
-                    
-            except asyncio.TimeoutError:
-                logger.error("Timeout waiting for fact checking and sentiment analysis to complete (30s)")
-                # Continue without calling Risk Score
+            risk_result = risk_task.result()
+            
+            # Call Press Secretary with all data if risk assessment succeeded;
+            # _call_risk_score reports failures as an error dict
+            risk_ok = "error" not in risk_result
+            if risk_ok and legal_result is not None:
+                press_response = await self._call_press_secretary(crisis, sentiment_result, fact_result, risk_result, legal_result)
+                if press_response:
+                    # Store the final response for retrieval by gateway
+                    logger.info("Storing final Press Secretary response for gateway retrieval")
+                    self.final_crisis_response = press_response
+                    self._display_final_crisis_response(crisis, press_response)
+            else:
+                logger.error("Cannot call Press Secretary - missing data. Risk: %s, Legal: %s", risk_ok, legal_result is not None)
                     
         except Exception as e:
-            logger.error(f"Error calling agents directly: {e}")
+            logger.error("Error calling agents directly: %s", e)
     
-    async def _call_sentiment_analyst(self, crisis_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Call the sentiment analyst agent directly via SLIM following lungo pattern."""
-        self.set_agent_status('sentiment_analyst', 'active')
+    def _build_request_payload(self, message_id: str, text: str,
+                               metadata: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Build a JSON-RPC message/send request from the static envelope template."""
+        message = {
+            "messageId": message_id,
+            "role": "user",
+            "parts": [{"type": "text", "text": text}]
+        }
+        if metadata is not None:
+            message["metadata"] = metadata
+        return {**self._rpc_template, "params": {"message": message}}
+    
+    async def _a2a_call(self, endpoint: str, message_id: str, prompt: str,
+                        metadata: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Send one message/send request to an agent via SLIM.
         
+        Failures of any kind are returned as {"error": ...} instead of raised.
+        """
         try:
-            # Simple prompt with crisis content (following lungo pattern)
-            prompt = f"Please analyze the sentiment of this crisis content: {crisis_data['text']}"
-            
-            # JSON-RPC request payload for A2A communication
-            request_payload = {
-                "jsonrpc": "2.0",
-                "method": "message/send",
-                "params": {
-                    "message": {
-                        "messageId": f"crisis-{crisis_data['crisis_id']}-sentiment",
-                        "role": "user",
-                        "parts": [
-                            {
-                                "type": "text",
-                                "text": prompt
-                            }
-                        ]
-                    }
-                },
-                "id": 1
-            }
-            
-            # Call sentiment analyst via SLIM
-            result = await call_agent_slim(
-                self.sentiment_analyst_endpoint,
-                request_payload,
-                timeout=30.0
+            result = await self._slim_client.call_agent(
+                endpoint,
+                self._build_request_payload(message_id, prompt, metadata),
+                timeout=AGENT_CALL_TIMEOUT
             )
-            
-            if "error" not in result:
-                logger.info(f"Sentiment analyst called successfully for crisis {crisis_data['crisis_id']}")
-                
-                # Extract and store sentiment analysis result
-                sentiment_analysis = self._extract_analysis_data(result, 'sentiment_analysis')
-                if sentiment_analysis:
-                    self.set_agent_result('sentiment_analyst', sentiment_analysis)
-                
-                self.set_agent_status('sentiment_analyst', 'complete')
-                return result
-            else:
-                logger.error(f"Sentiment analyst call failed via SLIM: {result.get('error', 'Unknown error')}")
-                self.set_agent_status('sentiment_analyst', 'error')
-                return {"error": result.get("error", "Unknown error")}
-                        
         except Exception as e:
-            logger.error(f"Error calling sentiment analyst via SLIM: {e}")
-            self.set_agent_status('sentiment_analyst', 'error')
             return {"error": str(e)}
+        
+        # Handle both dict and non-dict error responses
+        if not isinstance(result, dict):
+            return {"error": str(result)}
+        if "error" in result:
+            return {"error": result["error"]}
+        return result
     
-    async def _call_fact_checker(self, crisis_data: Dict[str, Any]) -> Dict[str, Any]:
+    async def _call_sentiment_analyst(self, crisis_id: str, text: str) -> Dict[str, Any]:
+        """Call the sentiment analyst agent directly via SLIM following lungo pattern."""
+        self.set_agent_status('sentiment_analyst', 'active')
+        
+        result = await self._a2a_call(
+            self.sentiment_analyst_endpoint, f"crisis-{crisis_id}-sentiment", SENTIMENT_PROMPT_PREFIX + text
+        )
+        if "error" in result:
+            logger.error("Sentiment analyst call failed via SLIM: %s", result["error"])
+            self.set_agent_status('sentiment_analyst', 'error')
+            return result
+            
+        logger.debug("Sentiment analyst called successfully for crisis %s", crisis_id)
+        
+        # Extract and store sentiment analysis result
+        sentiment_analysis = self._extract_analysis_data(result, 'sentiment_analysis')
+        if sentiment_analysis:
+            self.set_agent_result('sentiment_analyst', sentiment_analysis)
+        
+        self.set_agent_status('sentiment_analyst', 'complete')
+        return result
+    
+    async def _call_fact_checker(self, crisis_id: str, text: str) -> Dict[str, Any]:
         """Call the fact checker agent directly via SLIM following lungo pattern."""
-        self.set_agent_status('fact_checker', 'active')
         # Legal counsel will be called by fact checker, so mark it as active too
-        self.set_agent_status('legal_counsel', 'active')
+        self._bulk_status({'fact_checker': 'active', 'legal_counsel': 'active'})
         
-        try:
-            # Simple prompt with crisis content for fact checking
-            prompt = f"Please verify the claims in this crisis content: {crisis_data['text']}"
-            
-            # JSON-RPC request payload for A2A communication
-            request_payload = {
-                "jsonrpc": "2.0",
-                "method": "message/send",
-                "params": {
-                    "message": {
-                        "messageId": f"crisis-{crisis_data['crisis_id']}-factcheck",
-                        "role": "user",
-                        "parts": [
-                            {
-                                "type": "text",
-                                "text": prompt
-                            }
-                        ]
-                    }
-                },
-                "id": 1
-            }
-            
-            # Call fact checker via SLIM
-            result = await call_agent_slim(
-                self.fact_checker_endpoint,
-                request_payload,
-                timeout=30.0
-            )
-            
-            if "error" not in result:
-                logger.info(f"Fact checker called successfully for crisis {crisis_data['crisis_id']}")
-                
-                # Extract and store fact check analysis result
-                fact_analysis = self._extract_analysis_data(result, 'fact_check')
-                if fact_analysis:
-                    self.set_agent_result('fact_checker', fact_analysis)
-                
-                # Also check for legal review data and store it
-                legal_review = self._extract_analysis_data(result, 'legal_review')
-                if legal_review:
-                    self.set_agent_result('legal_counsel', legal_review)
-                    self.set_agent_status('legal_counsel', 'complete')
-                
-                self.set_agent_status('fact_checker', 'complete')
-                return result
-            else:
-                logger.error(f"Fact checker call failed via SLIM: {result.get('error', 'Unknown error')}")
-                self.set_agent_status('fact_checker', 'error')
-                self.set_agent_status('legal_counsel', 'error')
-                return {"error": result.get("error", "Unknown error")}
-                
-        except Exception as e:
-            logger.error(f"Error calling fact checker via SLIM: {e}")
-            self.set_agent_status('fact_checker', 'error')
-            self.set_agent_status('legal_counsel', 'error')
-            return {"error": str(e)}
+        result = await self._a2a_call(
+            self.fact_checker_endpoint, f"crisis-{crisis_id}-factcheck", FACT_CHECK_PROMPT_PREFIX + text
+        )
+        if "error" in result:
+            logger.error("Fact checker call failed via SLIM: %s", result["error"])
+            self._bulk_status({'fact_checker': 'error', 'legal_counsel': 'error'})
+            return result
+            
+        logger.debug("Fact checker called successfully for crisis %s", crisis_id)
+        
+        # Extract and store fact check analysis result
+        fact_analysis = self._extract_analysis_data(result, 'fact_check')
+        if fact_analysis:
+            self.set_agent_result('fact_checker', fact_analysis)
+        
+        # Also check for legal review data and store it
+        legal_review = self._extract_analysis_data(result, 'legal_review')
+        if legal_review:
+            self.set_agent_result('legal_counsel', legal_review)
+            self._bulk_status({'legal_counsel': 'complete', 'fact_checker': 'complete'})
+        else:
+            self.set_agent_status('fact_checker', 'complete')
+        return result
     
-    async def _call_risk_score(self, crisis_data: Dict[str, Any], sentiment_result: Dict[str, Any], fact_result: Dict[str, Any]) -> Dict[str, Any]:
+    async def _call_risk_score(self, crisis: CrisisData, sentiment_result: Dict[str, Any], fact_result: Dict[str, Any]) -> Dict[str, Any]:
         """Call the risk score agent with combined analysis data."""
+        crisis_id = crisis.crisis_id
+        
+        # Validate that both analyses can be extracted before doing any other work
+        sentiment_analysis = self._extract_analysis_data(sentiment_result, 'sentiment_analysis')
+        fact_analysis = self._extract_analysis_data(fact_result, 'fact_check_analysis')
+        if not sentiment_analysis or not fact_analysis:
+            logger.error("Failed to extract analysis data. Sentiment: %s, Fact: %s", bool(sentiment_analysis), bool(fact_analysis))
+            self.set_agent_status('risk_score', 'error')
+            return {"error": "Failed to extract analysis data from agent responses"}
+        
         self.set_agent_status('risk_score', 'active')
         
-        try:
-            # Use the improved extractor for both analyses
-            sentiment_analysis = self._extract_analysis_data(sentiment_result, 'sentiment_analysis')
-            fact_analysis = self._extract_analysis_data(fact_result, 'fact_check_analysis')
-            
-            # Validate that we successfully extracted analysis data
-            if not sentiment_analysis or not fact_analysis:
-                logger.error(f"Failed to extract analysis data. Sentiment: {bool(sentiment_analysis)}, Fact: {bool(fact_analysis)}")
-                # Detailed structures no longer logged to reduce noise
-                return {"error": "Failed to extract analysis data from agent responses"}
-            
-            # Prepare combined analysis data for Risk Score
-            combined_analysis = {
-                "crisis_id": crisis_data.get("crisis_id", "unknown"),
-                "fact_analysis": fact_analysis,
-                "sentiment_analysis": sentiment_analysis,
-                "timestamp": crisis_data.get("timestamp", ""),
-                "content": crisis_data.get("text", "")
-            }
-            
-            logger.info(f"Successfully extracted analysis data for crisis {crisis_data.get('crisis_id', 'unknown')}: fact_credibility={fact_analysis.get('overall_credibility', 'unknown')}, sentiment_score={sentiment_analysis.get('overall_sentiment', 'unknown')}")
-            
-            # Create prompt for Risk Score agent
-            prompt = f"Please assess the risk for this crisis with combined analysis: {json.dumps(combined_analysis)}"
-            
-            # JSON-RPC request payload for Risk Score
-            request_payload = {
-                "jsonrpc": "2.0",
-                "method": "message/send",
-                "params": {
-                    "message": {
-                        "messageId": f"risk-assessment-{crisis_data.get('crisis_id', 'unknown')}",
-                        "role": "user",
-                        "parts": [
-                            {
-                                "type": "text",
-                                "text": prompt
-                            }
-                        ]
-                    }
-                },
-                "id": 1
-            }
-            
-            # Call Risk Score via SLIM
-            result = await call_agent_slim(
-                self.risk_score_endpoint,
-                request_payload,
-                timeout=30.0
+        # Prepare combined analysis data for Risk Score
+        combined_analysis = {
+            "crisis_id": crisis_id,
+            "fact_analysis": fact_analysis,
+            "sentiment_analysis": sentiment_analysis,
+            "timestamp": crisis.timestamp,
+            "content": crisis.text
+        }
+        
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Successfully extracted analysis data for crisis %s: fact_credibility=%s, sentiment_score=%s",
+                crisis_id,
+                fact_analysis.get('overall_credibility', 'unknown'),
+                sentiment_analysis.get('overall_sentiment', 'unknown')
             )
-
-            # Check if result is dict and has no error
-            if isinstance(result, dict) and "error" not in result:
-                logger.info(f"Risk Score called successfully for crisis {crisis_data.get('crisis_id', 'unknown')}")
-                
-                # Extract and store risk analysis result
-                risk_analysis = self._extract_analysis_data(result, 'risk_assessment')
-                if risk_analysis:
-                    self.set_agent_result('risk_score', risk_analysis)
-                
-                self.set_agent_status('risk_score', 'complete')
-                return result
-            else:
-                # Handle both dict and string error responses
-                if isinstance(result, dict):
-                    error_msg = result.get('error', 'Unknown error')
-                else:
-                    error_msg = str(result)
-                logger.error(f"Risk Score call failed via SLIM: {error_msg}")
-                self.set_agent_status('risk_score', 'error')
-                return {"error": error_msg}
-                        
-        except Exception as e:
-            logger.error(f"Error calling Risk Score: {e}")
+        
+        # The prompt only routes the request; the analyses travel as structured
+        # message metadata instead of JSON stringified into the prompt text
+        result = await self._a2a_call(
+            self.risk_score_endpoint,
+            f"risk-assessment-{crisis_id}",
+            RISK_PROMPT_PREFIX.rstrip(),
+            metadata={"combined_analysis": combined_analysis}
+        )
+        if "error" in result:
+            logger.error("Risk Score call failed via SLIM: %s", result["error"])
             self.set_agent_status('risk_score', 'error')
-            return {"error": str(e)}
-    
-    def _extract_legal_counsel_data(self, fact_result: Dict[str, Any]) -> Dict[str, Any]:
-        """Extract legal counsel data from fact checker response (fact checker calls legal counsel)."""
-        try:
-            # Attempt to extract using the generic recursive extractor first
-            legal_review = self._extract_analysis_data(fact_result, 'legal_review')
-            if legal_review:
-                logger.info("Successfully extracted legal counsel review from fact checker result")
-                return legal_review
-
-            # Fallback to previous structured path for backward-compatibility
-            if isinstance(fact_result, dict):
-                if 'result' in fact_result and isinstance(fact_result['result'], dict):
-                    result_data = fact_result['result']
-                    if 'metadata' in result_data:
-                        metadata = result_data['metadata']
-                        if 'legal_review' in metadata:
-                            return metadata['legal_review']
-
-            # If still not found, log and return None so caller can decide how to proceed
-            logger.debug("Legal review not found in fact checker response")
-            return None
-         
-        except Exception as e:
-            logger.error(f"Error extracting legal counsel data: {e}")
-            return None
+            return result
+            
+        logger.debug("Risk Score called successfully for crisis %s", crisis_id)
+        
+        # Extract and store risk analysis result
+        risk_analysis = self._extract_analysis_data(result, 'risk_assessment')
+        if risk_analysis:
+            self.set_agent_result('risk_score', risk_analysis)
+        
+        self.set_agent_status('risk_score', 'complete')
+        return result
     
-    async def _call_press_secretary(self, crisis_data: Dict[str, Any], sentiment_result: Dict[str, Any], 
+    async def _call_press_secretary(self, crisis: CrisisData, sentiment_result: Dict[str, Any], 
                                   fact_result: Dict[str, Any], risk_result: Dict[str, Any], 
-                                  legal_result: Dict[str, Any]) -> Dict[str, Any]:
+                                  legal_result: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Call the Press Secretary agent with all comprehensive crisis analysis data."""
         self.set_agent_status('press_secretary', 'active')
+        crisis_id = crisis.crisis_id
+        
+        # Extract analysis data from each agent response
+        sentiment_analysis = self._extract_analysis_data(sentiment_result, 'sentiment_analysis')
+        fact_analysis = self._extract_analysis_data(fact_result, 'fact_analysis') 
+        risk_assessment = self._extract_analysis_data(risk_result, 'risk_assessment')
+        
+        # Prepare comprehensive crisis data package for Press Secretary.
+        # Only the fields the Press Secretary reads are sent, compactly encoded:
+        # pretty-printing and duplicated fields just inflate the prompt.
+        comprehensive_data = {
+            "crisis_id": crisis_id,
+            "crisis_data": {
+                "crisis_id": crisis_id,
+                "text": crisis.text,
+                "author": crisis.author,
+                "timestamp": crisis.timestamp
+            },
+            "sentiment_analysis": sentiment_analysis,
+            "fact_analysis": fact_analysis,
+            "risk_assessment": risk_assessment,
+            "legal_review": legal_result
+        }
         
         try:
-            # Extract analysis data from each agent response
-            sentiment_analysis = self._extract_analysis_data(sentiment_result, 'sentiment_analysis')
-            fact_analysis = self._extract_analysis_data(fact_result, 'fact_analysis') 
-            risk_assessment = self._extract_analysis_data(risk_result, 'risk_assessment')
-            
-            # Prepare comprehensive crisis data package for Press Secretary
-            comprehensive_data = {
-                "crisis_id": crisis_data.get("crisis_id", "unknown"),
-                "crisis_data": crisis_data,
-                "sentiment_analysis": sentiment_analysis,
-                "fact_analysis": fact_analysis,
-                "risk_assessment": risk_assessment,
-                "legal_review": legal_result,
-                "timestamp": crisis_data.get("timestamp", "")
-            }
-            
             # Create prompt for Press Secretary
             prompt = f"""Please generate official crisis response based on comprehensive analysis.
 
 CRISIS_DATA:
-{json.dumps(comprehensive_data, indent=2)}
+{json_utils.dumps(comprehensive_data)}
 END_CRISIS_DATA"""
-            
-            # JSON-RPC request payload for Press Secretary
-            request_payload = {
-                "jsonrpc": "2.0",
-                "method": "message/send",
-                "params": {
-                    "message": {
-                        "messageId": f"press-response-{crisis_data.get('crisis_id', 'unknown')}",
-                        "role": "user",
-                        "parts": [
-                            {
-                                "type": "text",
-                                "text": prompt
-                            }
-                        ]
-                    }
-                },
-                "id": 1
-            }
-            
-            # Call Press Secretary via SLIM
-            result = await call_agent_slim(
-                self.press_secretary_endpoint,
-                request_payload,
-                timeout=30.0
-            )
-
-            if "error" not in result:
-                logger.info(f"Press Secretary response generated for crisis {crisis_data.get('crisis_id', 'unknown')}")
-                
-                # Extract and store press secretary result
-                press_analysis = self._extract_analysis_data(result, 'press_response')
-                if press_analysis:
-                    self.set_agent_result('press_secretary', press_analysis)
-                
-                self.set_agent_status('press_secretary', 'complete')
-                return result
-            else:
-                logger.error(f"Press Secretary call failed via SLIM: {result.get('error', 'Unknown error')}")
-                self.set_agent_status('press_secretary', 'error')
-                return None
-                        
         except Exception as e:
-            logger.error(f"Error calling Press Secretary agent: {e}")
+            logger.error("Error encoding Press Secretary crisis data: %s", e)
+            self.set_agent_status('press_secretary', 'error')
+            return None
+            
+        result = await self._a2a_call(self.press_secretary_endpoint, f"press-response-{crisis_id}", prompt)
+        if "error" in result:
+            logger.error("Press Secretary call failed via SLIM: %s", result["error"])
             self.set_agent_status('press_secretary', 'error')
             return None
+            
+        logger.info("Press Secretary response generated for crisis %s", crisis_id)
+        
+        # Extract and store press secretary result
+        press_analysis = self._extract_analysis_data(result, 'press_response')
+        if press_analysis:
+            self.set_agent_result('press_secretary', press_analysis)
+        
+        self.set_agent_status('press_secretary', 'complete')
+        return result
     
     def _extract_analysis_data(self, agent_result: Dict[str, Any], analysis_key: str) -> Dict[str, Any]:
         """Extract analysis data from agent response."""
@@ -580,45 +647,127 @@ END_CRISIS_DATA"""
             if not agent_result:
                 return {}
 
-            # Helper to look for metadata recursively
-            def _search(node: Any) -> Optional[Dict[str, Any]]:
-                if isinstance(node, dict):
-                    # Direct hit
-                    if analysis_key in node:
-                        return node[analysis_key]
-                    # Metadata path
-                    if 'metadata' in node and isinstance(node['metadata'], dict) and analysis_key in node['metadata']:
-                        return node['metadata'][analysis_key]
-                    # Recurse on dict values
-                    for v in node.values():
-                        found = _search(v)
-                        if found is not None:
-                            return found
-                elif isinstance(node, list):
-                    for item in node:
-                        found = _search(item)
-                        if found is not None:
-                            return found
-                return None
-
-            found_data = _search(agent_result)
+            # Fast path: SLIM envelopes carry the analysis at result[key] or
+            # result.metadata[key], the first places a full search would look
+            # when everything ahead of 'result' is a scalar (id, jsonrpc)
+            result = agent_result.get('result')
+            if isinstance(result, dict) and self._is_flat_envelope(agent_result, analysis_key):
+                if analysis_key in result:
+                    found_data = result[analysis_key]
+                else:
+                    metadata = result.get('metadata')
+                    found_data = metadata.get(analysis_key) if isinstance(metadata, dict) else None
+                # A None hit hides the rest of 'result' but not later siblings;
+                # leave that case to the full search
+                if found_data is not None:
+                    return found_data
+
+            found_data = self._index_agent_result(agent_result).get(analysis_key)
             if found_data is None:
-                logger.debug(f"Could not extract {analysis_key} from agent result")
+                logger.debug("Could not extract %s from agent result", analysis_key)
                 return {}
             return found_data
         except Exception as e:
-            logger.error(f"Error extracting {analysis_key}: {e}")
+            logger.error("Error extracting %s: %s", analysis_key, e)
             return {}
 
+    @staticmethod
+    def _is_flat_envelope(agent_result: Dict[str, Any], analysis_key: str) -> bool:
+        """Check that nothing ahead of 'result' could hold analysis_key."""
+        if analysis_key in agent_result or 'metadata' in agent_result:
+            return False
+        for key, value in agent_result.items():
+            if key == 'result':
+                return True
+            if isinstance(value, (dict, list)):
+                return False
+        return False
+
+    def _index_agent_result(self, agent_result: Any) -> Dict[str, Any]:
+        """Index every key of an agent response in a single depth-first pass.
+
+        Lookups match a fresh recursive search: the first dict in pre-order
+        that holds a key (directly, or else under its 'metadata' dict) decides
+        it. When that value is None the search for the key skips the rest of
+        the dict's subtree and carries on with its later siblings. Within a
+        crisis pipeline indexes are cached per response.
+        """
+        cache = _crisis_indexes.get()
+        if cache is not None:
+            cached = cache.get(id(agent_result))
+            if cached is not None and cached[0] is agent_result:
+                return cached[1]
+
+        index: Dict[str, Any] = {}
+        # Explicit stack instead of recursion; children are pushed in reverse
+        # so they are visited in their original order. Each entry carries the
+        # keys hidden from its subtree by a None hit in an ancestor.
+        no_keys: frozenset = frozenset()
+        stack: List[Tuple[Any, frozenset]] = [(agent_result, no_keys)]
+        pop = stack.pop
+        push = stack.extend
+        while stack:
+            node, hidden = pop()
+            if isinstance(node, dict):
+                none_hits = None
+                for key, value in node.items():
+                    if key in index or key in hidden:
+                        continue
+                    if value is None:
+                        none_hits = none_hits or set()
+                        none_hits.add(key)
+                    else:
+                        index[key] = value
+                metadata = node.get('metadata')
+                if isinstance(metadata, dict):
+                    for key, value in metadata.items():
+                        if key in node or key in index or key in hidden:
+                            continue
+                        if value is None:
+                            none_hits = none_hits or set()
+                            none_hits.add(key)
+                        else:
+                            index[key] = value
+                if none_hits:
+                    hidden = hidden.union(none_hits)
+                push([(child, hidden) for child in reversed(node.values())])
+            elif isinstance(node, list):
+                push([(child, hidden) for child in reversed(node)])
+
+        # Keep a reference to the response so its id() cannot be reused while cached
+        if cache is not None:
+            cache[id(agent_result)] = (agent_result, index)
+        return index
+
     def stop(self) -> None:
-        """Stop the streaming service."""
+        """Stop the streaming service.
+        
+        Cancels a running start() so in-flight agent calls are aborted
+        instead of running out their 30 s timeouts.
+        """
         self._is_running = False
+        task = self._stream_task
+        if task is not None and not task.done():
+            task.cancel()
         logger.info("Tweet streaming service stopped")
 
-    def _display_final_crisis_response(self, crisis_data: Dict[str, Any], press_response: Dict[str, Any]) -> None:
+    async def aclose(self) -> None:
+        """Stop the service and close pooled SLIM connections."""
+        task = self._stream_task
+        self.stop()
+        # Let cancelled calls unwind before their clients are closed
+        if task is not None and task is not asyncio.current_task():
+            await asyncio.wait({task})
+        await self._slim_client.close()
+
+    def _display_final_crisis_response(self, crisis: CrisisData, press_response: Dict[str, Any]) -> None:
         """Display the final crisis response in a nicely formatted way."""
+        # The banner is log output only; skip the lookups and formatting when silenced
+        if not logger.isEnabledFor(logging.INFO):
+            return
+            
         try:
-            crisis_id = crisis_data.get('crisis_id', 'unknown')
+            crisis_id = crisis.crisis_id
             
             # Extract the press response from the JSON-RPC envelope
             final_response = None
@@ -676,7 +825,7 @@ END_CRISIS_DATA"""
                 
         except Exception as e:
             logger.error(f"Error displaying final crisis response: {e}")
-            logger.info(f"🎯 Crisis response generated for crisis {crisis_data.get('crisis_id', 'unknown')}")
+            logger.info(f"🎯 Crisis response generated for crisis {crisis.crisis_id}")
 
     def get_final_response(self) -> Optional[Dict[str, Any]]:
         """Get the final crisis response for external consumption (e.g., by gateway)."""
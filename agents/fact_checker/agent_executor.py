@@ -4,7 +4,6 @@ import asyncio
 import logging
 from uuid import uuid4
 from typing import Dict, Any
-import json
 
 from a2a.server.agent_execution import AgentExecutor, RequestContext
 from a2a.server.events import EventQueue
@@ -25,8 +24,9 @@ from a2a.utils import (
 )
 
 from agents.fact_checker.agent import FactCheckerAgent
-from agents.fact_checker.card import AGENT_CARD
+from agents.fact_checker.card import AGENT_CARD_JSON
 from agents.fact_checker.config import FactCheckerConfig
+from common import json_utils
 from common.slim_client import call_agent_slim
 
 logger = logging.getLogger("orbit.fact_checker_agent.agent_executor")
@@ -37,7 +37,7 @@ class FactCheckerAgentExecutor(AgentExecutor):
     
     def __init__(self):
         self.agent = FactCheckerAgent()
-        self.agent_card = AGENT_CARD.model_dump(mode="json", exclude_none=True)
+        self.agent_card = AGENT_CARD_JSON
         self.config = FactCheckerConfig()
         
     def _validate_request(self, context: RequestContext) -> JSONRPCResponse | None:
@@ -94,7 +94,7 @@ class FactCheckerAgentExecutor(AgentExecutor):
                     # Try to parse JSON string returned by LLM
                     parsed: Dict[str, Any] | None = None
                     try:
-                        parsed_json = json.loads(agent_response)
+                        parsed_json = json_utils.loads(agent_response)
                         if isinstance(parsed_json, dict):
                             parsed = parsed_json
                     except Exception:
@@ -129,7 +129,7 @@ class FactCheckerAgentExecutor(AgentExecutor):
                 message_metadata["legal_review"] = legal_review_data
             
             message = Message(
-                messageId=str(uuid4()),
+                messageId=uuid4().hex,
                 role=Role.agent,
                 metadata=message_metadata,
                 parts=[Part(TextPart(text=agent_response))]
@@ -162,7 +162,7 @@ Please assess legal risks, compliance issues, and provide recommendations.
                 "method": "message/send",
                 "params": {
                     "message": {
-                        "messageId": f"legal-review-{uuid4()}",
+                        "messageId": f"legal-review-{uuid4().hex}",
                         "role": "user",
                         "parts": [
                             {
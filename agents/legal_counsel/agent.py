@@ -1,6 +1,5 @@
 """Core agent logic for the Legal Counsel agent."""
 
-import json
 import logging
 import os
 from pathlib import Path
@@ -14,6 +13,7 @@ from langgraph.graph.message import add_messages
 from typing_extensions import Annotated
 from pydantic import BaseModel, Field, ValidationError
 
+from common import json_utils
 from common.llm import get_llm
 
 logger = logging.getLogger("orbit.legal_counsel_agent.agent")
@@ -217,7 +217,7 @@ Respond with ONLY the JSON object, no additional text or explanation."""
             
             # Parse and validate JSON response
             try:
-                raw_response = json.loads(llm_response.content)
+                raw_response = json_utils.loads(llm_response.content)
                 
                 # Validate response against schema
                 try:
@@ -238,7 +238,7 @@ Respond with ONLY the JSON object, no additional text or explanation."""
                     logger.error(f"LLM response failed schema validation: {e}")
                     return self._create_error_response(f"Invalid LLM response format: {str(e)}")
                 
-            except json.JSONDecodeError as e:
+            except json_utils.JSONDecodeError as e:
                 logger.error(f"Failed to parse LLM legal review response as JSON: {e}")
                 return self._create_error_response("Failed to parse legal review")
                 
@@ -1,7 +1,6 @@
 """Agent executor for the Legal Counsel agent."""
 
 import asyncio
-import json
 import logging
 from uuid import uuid4
 
@@ -24,7 +23,7 @@ from a2a.utils import (
 )
 
 from agents.legal_counsel.agent import LegalCounselAgent
-from agents.legal_counsel.card import AGENT_CARD
+from agents.legal_counsel.card import AGENT_CARD_JSON
 from agents.legal_counsel.config import LegalCounselConfig
 
 logger = logging.getLogger("orbit.legal_counsel_agent.agent_executor")
@@ -35,7 +34,7 @@ class LegalCounselAgentExecutor(AgentExecutor):
     
     def __init__(self):
         self.agent = LegalCounselAgent()
-        self.agent_card = AGENT_CARD.model_dump(mode="json", exclude_none=True)
+        self.agent_card = AGENT_CARD_JSON
         self.config = LegalCounselConfig()
         
     def _validate_request(self, context: RequestContext) -> JSONRPCResponse | None:
@@ -86,7 +85,7 @@ class LegalCounselAgentExecutor(AgentExecutor):
                 
                 # Store legal result for potential future use
                 message = Message(
-                    messageId=str(uuid4()),
+                    messageId=uuid4().hex,
                     role=Role.agent,
                     metadata={
                         "name": self.agent_card["name"],
@@ -101,7 +100,7 @@ class LegalCounselAgentExecutor(AgentExecutor):
                 
                 # Create standard response message
                 message = Message(
-                    messageId=str(uuid4()),
+                    messageId=uuid4().hex,
                     role=Role.agent,
                     metadata={"name": self.agent_card["name"]},
                     parts=[Part(TextPart(text=output))]
@@ -1,6 +1,5 @@
 """Core agent logic for the Press Secretary agent."""
 
-import json
 import logging
 import os
 from typing import Dict, List, Any, Literal
@@ -13,6 +12,7 @@ from langgraph.graph.message import add_messages
 from typing_extensions import Annotated
 from pydantic import BaseModel, Field, ValidationError
 
+from common import json_utils
 from common.llm import get_llm
 
 logger = logging.getLogger("orbit.press_secretary_agent.agent")
@@ -218,7 +218,7 @@ Respond with ONLY the JSON object, no additional text or explanation."""
             
             # Parse and validate JSON response
             try:
-                raw_response = json.loads(llm_response.content)
+                raw_response = json_utils.loads(llm_response.content)
                 validated_response = PressResponse(**raw_response)
                 
                 state["press_response"] = validated_response.model_dump()
@@ -230,7 +230,7 @@ Respond with ONLY the JSON object, no additional text or explanation."""
                 
                 logger.info(f"Press response generated with tone: {validated_response.tone}")
                 
-            except (json.JSONDecodeError, ValidationError) as e:
+            except (json_utils.JSONDecodeError, ValidationError) as e:
                 logger.error(f"Failed to parse/validate LLM response: {e}")
                 state["messages"] = add_messages(state["messages"], [
                     AIMessage(content="Failed to generate crisis response - invalid format")
@@ -315,7 +315,7 @@ Respond with ONLY the JSON object, no additional text or explanation."""
             
             # Parse and validate JSON response
             try:
-                raw_response = json.loads(llm_response.content)
+                raw_response = json_utils.loads(llm_response.content)
                 validated_response = PressResponse(**raw_response)
                 
                 # Convert to dict and add metadata
@@ -329,7 +329,7 @@ Respond with ONLY the JSON object, no additional text or explanation."""
                 logger.info(f"Crisis response generated: {press_response['tone']} tone")
                 return press_response
                 
-            except (json.JSONDecodeError, ValidationError) as e:
+            except (json_utils.JSONDecodeError, ValidationError) as e:
                 logger.error(f"LLM response failed validation: {e}")
                 return self._create_error_response(f"Invalid LLM response format: {str(e)}")
                 
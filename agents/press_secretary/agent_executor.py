@@ -1,7 +1,6 @@
 """Agent executor for the Press Secretary agent."""
 
 import asyncio
-import json
 import logging
 from typing import Any
 from uuid import uuid4
@@ -25,8 +24,9 @@ from a2a.utils import (
 )
 
 from agents.press_secretary.agent import PressSecretaryAgent
-from agents.press_secretary.card import AGENT_CARD
+from agents.press_secretary.card import AGENT_CARD_JSON
 from agents.press_secretary.config import PressSecretaryConfig
+from common import json_utils
 
 logger = logging.getLogger("orbit.press_secretary_agent.agent_executor")
 
@@ -36,7 +36,7 @@ class PressSecretaryAgentExecutor(AgentExecutor):
     
     def __init__(self):
         self.agent = PressSecretaryAgent()
-        self.agent_card = AGENT_CARD.model_dump(mode="json", exclude_none=True)
+        self.agent_card = AGENT_CARD_JSON
         self.config = PressSecretaryConfig()
         
     def _validate_request(self, context: RequestContext) -> JSONRPCResponse | None:
@@ -105,7 +105,7 @@ class PressSecretaryAgentExecutor(AgentExecutor):
                 
                 # Create standard response message
                 response_message = Message(
-                    messageId=str(uuid4()),
+                    messageId=uuid4().hex,
                     role=Role.agent,
                     parts=[TextPart(text=output)],
                     metadata={
@@ -133,14 +133,14 @@ class PressSecretaryAgentExecutor(AgentExecutor):
                 end_idx = prompt.find(end_marker)
                 crisis_json = prompt[start_idx:end_idx].strip()
                 
-                crisis_data = json.loads(crisis_json)
+                crisis_data = json_utils.loads(crisis_json)
                 logger.info(f"Extracted crisis data for ID: {crisis_data.get('crisis_id', 'unknown')}")
                 return crisis_data
             
             logger.warning("No crisis data markers found in prompt")
             return None
             
-        except json.JSONDecodeError as e:
+        except json_utils.JSONDecodeError as e:
             logger.error(f"Failed to parse crisis JSON data: {e}")
             return None
         except Exception as e:
@@ -158,7 +158,7 @@ class PressSecretaryAgentExecutor(AgentExecutor):
         )
         
         return Message(
-            messageId=str(uuid4()),
+            messageId=uuid4().hex,
             role=Role.agent,
             parts=[TextPart(text=response_text)],
             metadata={
@@ -176,7 +176,7 @@ class PressSecretaryAgentExecutor(AgentExecutor):
     def _create_error_message(self, error_details: str) -> Message:
         """Create error response message."""
         return Message(
-            messageId=str(uuid4()),
+            messageId=uuid4().hex,
             role=Role.agent,
             parts=[TextPart(text=f"Press Secretary error: {error_details}")],
             metadata={
@@ -1,6 +1,5 @@
 """Core agent logic for the Risk Score agent."""
 
-import json
 import logging
 import os
 from typing import Dict, List, Any, Literal
@@ -13,6 +12,7 @@ from langgraph.graph.message import add_messages
 from typing_extensions import Annotated
 from pydantic import BaseModel, Field, ValidationError
 
+from common import json_utils
 from common.llm import get_llm
 
 logger = logging.getLogger("orbit.risk_score_agent.agent")
@@ -185,14 +185,14 @@ Respond with ONLY the JSON object, no additional text or explanation."""
             
             # Use LLM to assess risk
             prompt = self.risk_assessment_prompt.format(
-                fact_analysis=json.dumps(fact_analysis, indent=2),
-                sentiment_analysis=json.dumps(sentiment_analysis, indent=2)
+                fact_analysis=json_utils.dumps(fact_analysis, indent=True),
+                sentiment_analysis=json_utils.dumps(sentiment_analysis, indent=True)
             )
             llm_response = await self.llm.ainvoke(prompt)
             
             # Parse and validate JSON response
             try:
-                raw_response = json.loads(llm_response.content)
+                raw_response = json_utils.loads(llm_response.content)
                 
                 # Validate response against schema
                 try:
@@ -222,7 +222,7 @@ Respond with ONLY the JSON object, no additional text or explanation."""
                     logger.error(f"LLM response failed schema validation: {e}")
                     return self._create_error_response(f"Invalid LLM response format: {str(e)}")
                 
-            except json.JSONDecodeError as e:
+            except json_utils.JSONDecodeError as e:
                 logger.error(f"Failed to parse LLM risk assessment response as JSON: {e}")
                 return self._create_error_response("Failed to parse risk assessment")
                 
@@ -1,7 +1,6 @@
 """Agent executor for the Risk Score agent."""
 
 import asyncio
-import json
 import logging
 from uuid import uuid4
 
@@ -24,8 +23,9 @@ from a2a.utils import (
 )
 
 from agents.risk_score.agent import RiskScoreAgent
-from agents.risk_score.card import AGENT_CARD
+from agents.risk_score.card import AGENT_CARD_JSON
 from agents.risk_score.config import RiskScoreConfig
+from common import json_utils
 
 logger = logging.getLogger("orbit.risk_score_agent.agent_executor")
 
@@ -35,7 +35,7 @@ class RiskScoreAgentExecutor(AgentExecutor):
     
     def __init__(self):
         self.agent = RiskScoreAgent()
-        self.agent_card = AGENT_CARD.model_dump(mode="json", exclude_none=True)
+        self.agent_card = AGENT_CARD_JSON
         self.config = RiskScoreConfig()
         
     def _validate_request(self, context: RequestContext) -> JSONRPCResponse | None:
@@ -71,13 +71,13 @@ class RiskScoreAgentExecutor(AgentExecutor):
         try:
             # Check if this is a crisis risk assessment request with combined analysis
             if "Please assess the risk for this crisis with combined analysis:" in prompt:
-                # Extract and parse the combined analysis data
-                content_start = prompt.find("Please assess the risk for this crisis with combined analysis:") + len("Please assess the risk for this crisis with combined analysis:")
-                combined_data = prompt[content_start:].strip()
-                
                 try:
-                    # Parse the combined analysis data (should be JSON from Ear-to-Ground)
-                    analysis_data = json.loads(combined_data)
+                    # Ear-to-Ground sends the combined analysis as structured message
+                    # metadata; JSON embedded in the prompt text is still accepted
+                    analysis_data = (context.message.metadata or {}).get("combined_analysis")
+                    if analysis_data is None:
+                        content_start = prompt.find("Please assess the risk for this crisis with combined analysis:") + len("Please assess the risk for this crisis with combined analysis:")
+                        analysis_data = json_utils.loads(prompt[content_start:].strip())
                     fact_analysis = analysis_data.get("fact_analysis", {})
                     sentiment_analysis = analysis_data.get("sentiment_analysis", {})
                     crisis_id = analysis_data.get("crisis_id", "unknown")
@@ -93,7 +93,7 @@ class RiskScoreAgentExecutor(AgentExecutor):
                     
                     # Store risk result for potential future use
                     message = Message(
-                        messageId=str(uuid4()),
+                        messageId=uuid4().hex,
                         role=Role.agent,
                         metadata={
                             "name": self.agent_card["name"],
@@ -103,11 +103,11 @@ class RiskScoreAgentExecutor(AgentExecutor):
                         parts=[Part(TextPart(text=response_text))]
                     )
                     
-                except json.JSONDecodeError as e:
+                except json_utils.JSONDecodeError as e:
                     logger.error(f"Failed to parse combined analysis data: {e}")
                     error_response = "Error: Invalid combined analysis data format"
                     message = Message(
-                        messageId=str(uuid4()),
+                        messageId=uuid4().hex,
                         role=Role.agent,
                         metadata={"name": self.agent_card["name"], "error": "parse_error"},
                         parts=[Part(TextPart(text=error_response))]
@@ -117,7 +117,7 @@ class RiskScoreAgentExecutor(AgentExecutor):
                     logger.error(f"Error processing risk assessment: {e}")
                     error_response = f"Error processing risk assessment: {str(e)}"
                     message = Message(
-                        messageId=str(uuid4()),
+                        messageId=uuid4().hex,
                         role=Role.agent,
                         metadata={"name": self.agent_card["name"], "error": "processing_error"},
                         parts=[Part(TextPart(text=error_response))]
@@ -128,7 +128,7 @@ class RiskScoreAgentExecutor(AgentExecutor):
                 
                 # Create standard response message
                 message = Message(
-                    messageId=str(uuid4()),
+                    messageId=uuid4().hex,
                     role=Role.agent,
                     metadata={"name": self.agent_card["name"]},
                     parts=[Part(TextPart(text=output))]
@@ -1,112 +1,34 @@
 """Server for the Risk Score agent."""
 
-import asyncio
 import logging
-import os
-import signal
-import sys
 from typing import Optional
-from uvicorn import Config, Server
 
-from a2a.server.request_handlers import DefaultRequestHandler
-from a2a.server.apps import A2AStarletteApplication
-from a2a.server.tasks import InMemoryTaskStore
+from a2a.server.agent_execution import AgentExecutor
 from dotenv import load_dotenv
 
-# SLIM integration imports
-from agntcy_app_sdk.factory import GatewayFactory, TransportTypes
-
 from agents.risk_score.agent_executor import RiskScoreAgentExecutor
 from agents.risk_score.card import AGENT_CARD
 from agents.risk_score.config import RiskScoreConfig
+from common.agent_server import AgentServer
 
 load_dotenv()
 
 logger = logging.getLogger("orbit.risk_score_agent.server")
 
 
-class RiskScoreServer:
+class RiskScoreServer(AgentServer):
     """Server for the Risk Score agent."""
     
+    agent_name = "Risk Score"
+    agent_card = AGENT_CARD
+    logger = logger
+    
     def __init__(self, config: Optional[RiskScoreConfig] = None):
-        self.config = config or RiskScoreConfig()
-        self.app = None
-        self.bridge = None
-        self._shutdown_event = asyncio.Event()
-        
-    def _setup_signal_handlers(self) -> None:
-        """Setup signal handlers for graceful shutdown."""
-        def signal_handler(signum, _):
-            logger.info(f"Received signal {signum}, initiating graceful shutdown...")
-            self._shutdown_event.set()
-            
-        signal.signal(signal.SIGINT, signal_handler)
-        signal.signal(signal.SIGTERM, signal_handler)
-        
-    async def start(self) -> None:
-        """Start the Risk Score agent server."""
-        logger.info(f"Starting Risk Score agent on port {self.config.agent_port}")
-        
-        # Setup signal handlers
-        self._setup_signal_handlers()
-        
-        # Create A2A application  
-        request_handler = DefaultRequestHandler(
-            agent_executor=RiskScoreAgentExecutor(),
-            task_store=InMemoryTaskStore()
-        )
-        
-        self.app = A2AStarletteApplication(
-            agent_card=AGENT_CARD,
-            http_handler=request_handler
-        )
-        
-        # Setup SLIM bridge to central server
-        factory = GatewayFactory()
-        slim_endpoint = os.getenv('SLIM_ENDPOINT', 'slim://slim:46357')
-        slim_transport = factory.create_transport(
-            transport=TransportTypes.SLIM.value,
-            endpoint=slim_endpoint
-        )
-        
-        self.bridge = factory.create_bridge(self.app, transport=slim_transport)
-        
-        # Start SLIM bridge (connects to central server)
-        logger.info(f"Connecting to central SLIM server at {slim_endpoint}")
-        await self.bridge.start()
-        
-        # Start HTTP server for UI compatibility
-        config = Config(
-            app=self.app.build(), 
-            host="0.0.0.0", 
-            port=self.config.agent_port, 
-            loop="asyncio"
-        )
-        userver = Server(config)
-        logger.info(f"HTTP A2A server started on port {self.config.agent_port}")
-        logger.info(f"SLIM gRPC bridge connected to {slim_endpoint}")
-        
-        # Run HTTP server
-        try:
-            await userver.serve()
-        except KeyboardInterrupt:
-            logger.info("Shutting down Risk Score agent server")
-        except Exception as e:
-            logger.error(f"Error running server: {e}")
-            raise
-            
-    async def _wait_for_shutdown(self) -> None:
-        """Wait for shutdown event."""
-        await self._shutdown_event.wait()
-        logger.info("Shutdown event received")
+        super().__init__(config or RiskScoreConfig())
         
-    async def _cleanup(self) -> None:
-        """Cleanup resources during shutdown."""
-        logger.info("Starting cleanup...")
-        if self.bridge:
-            # Bridge cleanup would be handled by the factory if needed
-            pass
-        logger.info("Cleanup completed")
+    async def _create_agent_executor(self) -> AgentExecutor:
+        """Create the Risk Score agent executor."""
+        return RiskScoreAgentExecutor()
 
 
 if __name__ == "__main__":
@@ -116,4 +38,4 @@ if __name__ == "__main__":
     )
     
     server = RiskScoreServer()
-    asyncio.run(server.start()) 
\ No newline at end of file
+    server.run()
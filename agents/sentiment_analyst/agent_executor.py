@@ -23,7 +23,7 @@ from a2a.utils import (
 )
 
 from agents.sentiment_analyst.agent import SentimentAnalystAgent
-from agents.sentiment_analyst.card import AGENT_CARD
+from agents.sentiment_analyst.card import AGENT_CARD_JSON
 from agents.sentiment_analyst.config import SentimentAnalystConfig
 
 logger = logging.getLogger("orbit.sentiment_analyst_agent.agent_executor")
@@ -34,7 +34,7 @@ class SentimentAnalystAgentExecutor(AgentExecutor):
     
     def __init__(self):
         self.agent = SentimentAnalystAgent()
-        self.agent_card = AGENT_CARD.model_dump(mode="json", exclude_none=True)
+        self.agent_card = AGENT_CARD_JSON
         self.config = SentimentAnalystConfig()
         
     def _validate_request(self, context: RequestContext) -> JSONRPCResponse | None:
@@ -90,7 +90,7 @@ class SentimentAnalystAgentExecutor(AgentExecutor):
                                f"Key emotions: {', '.join(sentiment_result.get('key_emotions', []))}"
                 
                 message = Message(
-                    messageId=str(uuid4()),
+                    messageId=uuid4().hex,
                     role=Role.agent,
                     metadata={
                         "name": self.agent_card["name"],
@@ -105,7 +105,7 @@ class SentimentAnalystAgentExecutor(AgentExecutor):
                 
                 # Create standard response message
                 message = Message(
-                    messageId=str(uuid4()),
+                    messageId=uuid4().hex,
                     role=Role.agent,
                     metadata={"name": self.agent_card["name"]},
                     parts=[Part(TextPart(text=output))]
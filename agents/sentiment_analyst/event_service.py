@@ -1,7 +1,6 @@
 """Event handling service for the Sentiment Analyst agent."""
 
 import asyncio
-import json
 import logging
 from datetime import datetime, timezone
 from pathlib import Path
@@ -9,8 +8,9 @@ from typing import Any, Dict, List, Optional
 
 from agntcy_app_sdk.protocols.message import Message
 
-from agents.sentiment_analyst.card import AGENT_CARD
+from agents.sentiment_analyst.card import AGENT_CARD_JSON
 from agents.sentiment_analyst.agent import SentimentAnalystAgent
+from common import json_utils
 
 logger = logging.getLogger("orbit.sentiment_analyst_agent.event_service")
 
@@ -26,8 +26,8 @@ class SentimentEventService:
         self.crisis_topic = crisis_topic
         self.agent = SentimentAnalystAgent()
         self._is_running = False
-        # Convert agent card to dict following Coffee AGNTCY pattern
-        self.agent_card = AGENT_CARD.model_dump(mode="json", exclude_none=True)
+        # Agent card dict following Coffee AGNTCY pattern
+        self.agent_card = AGENT_CARD_JSON
         
     async def start(self) -> None:
         """Start the sentiment event service."""
@@ -97,11 +97,10 @@ class SentimentEventService:
             "analysis": sentiment_result
         }
         
-        # Create proper SDK Message
-        payload_json = json.dumps(completion_data)
+        # Create proper SDK Message; the payload is encoded straight to bytes
         message = Message(
             type="sentiment_complete",
-            payload=payload_json.encode('utf-8'),
+            payload=json_utils.dumpb(completion_data),
             headers={"content-type": "application/json"},
             method="POST"
         )
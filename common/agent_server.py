@@ -0,0 +1,126 @@
+"""Shared A2A server bootstrap for Orbit agents."""
+
+import asyncio
+import logging
+import os
+import signal
+from abc import ABC, abstractmethod
+from typing import Any, Optional
+
+from a2a.server.agent_execution import AgentExecutor
+from a2a.server.apps import A2AStarletteApplication
+from a2a.server.request_handlers import DefaultRequestHandler
+from a2a.server.tasks import InMemoryTaskStore
+from a2a.types import AgentCard
+
+# SLIM integration imports
+from agntcy_app_sdk.factory import GatewayFactory, TransportTypes
+from uvicorn import Config, Server
+
+try:
+    import uvloop
+except ImportError:  # uvloop is optional; the default asyncio loop is used without it
+    uvloop = None
+
+
+class AgentServer(ABC):
+    """Base server running an agent over HTTP A2A with a SLIM bridge.
+
+    Subclasses set ``agent_name``, ``agent_card`` and ``logger`` and implement
+    ``_create_agent_executor``.
+    """
+
+    agent_name: str = "Orbit"
+    agent_card: AgentCard
+    logger: logging.Logger = logging.getLogger("orbit.agent_server")
+    ready_message: Optional[str] = None
+
+    def __init__(self, config: Any):
+        self.config = config
+        self.app = None
+        self.bridge = None
+
+    def _setup_signal_handlers(self) -> None:
+        """Setup signal handlers for graceful shutdown."""
+        # uvicorn re-raises the signal that stopped serve(); logging here instead
+        # of using the default handler lets start() finish its cleanup
+        def signal_handler(signum, _):
+            self.logger.info("Received signal %s, initiating graceful shutdown...", signum)
+
+        signal.signal(signal.SIGINT, signal_handler)
+        signal.signal(signal.SIGTERM, signal_handler)
+
+    @abstractmethod
+    async def _create_agent_executor(self) -> AgentExecutor:
+        """Create the agent executor served by this server."""
+
+    async def start(self) -> None:
+        """Start the agent server."""
+        self.logger.info("Starting %s agent on port %s", self.agent_name, self.config.agent_port)
+
+        # Setup signal handlers
+        self._setup_signal_handlers()
+
+        # Create A2A application
+        request_handler = DefaultRequestHandler(
+            agent_executor=await self._create_agent_executor(),
+            task_store=InMemoryTaskStore()
+        )
+
+        self.app = A2AStarletteApplication(
+            agent_card=self.agent_card,
+            http_handler=request_handler
+        )
+
+        # Setup SLIM bridge to central server (lungo pattern)
+        factory = GatewayFactory()
+        slim_endpoint = os.getenv('SLIM_ENDPOINT', 'slim://slim:46357')
+        slim_transport = factory.create_transport(
+            transport=TransportTypes.SLIM.value,
+            endpoint=slim_endpoint
+        )
+
+        self.bridge = factory.create_bridge(self.app, transport=slim_transport)
+
+        # Start SLIM bridge (connects to central server)
+        self.logger.info("Connecting to central SLIM server at %s", slim_endpoint)
+        await self.bridge.start()
+
+        # Start HTTP server for Gateway UI compatibility
+        config = Config(
+            app=self.app.build(),
+            host="0.0.0.0",
+            port=self.config.agent_port,
+            loop="asyncio"
+        )
+        userver = Server(config)
+        self.logger.info("HTTP A2A server started on port %s", self.config.agent_port)
+        self.logger.info("SLIM gRPC bridge connected to %s", slim_endpoint)
+        if self.ready_message:
+            self.logger.info(self.ready_message)
+
+        # Run HTTP server; uvicorn returns from serve() on SIGINT/SIGTERM
+        try:
+            await userver.serve()
+        except KeyboardInterrupt:
+            self.logger.info("Shutting down %s agent server", self.agent_name)
+        except Exception as e:
+            self.logger.error("Error running server: %s", e)
+            raise
+        finally:
+            await self._cleanup()
+
+    def run(self) -> None:
+        """Run the server to completion, on uvloop when it is installed."""
+        if uvloop is not None:
+            uvloop.run(self.start())
+        else:
+            asyncio.run(self.start())
+
+    async def _cleanup(self) -> None:
+        """Cleanup resources during shutdown."""
+        self.logger.info("Starting cleanup...")
+        if self.bridge:
+            # Bridge cleanup would be handled by the factory if needed
+            pass
+        self.logger.info("Cleanup completed")
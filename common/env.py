@@ -0,0 +1,10 @@
+"""Load the project .env file before any settings are read at import time.
+
+Modules that resolve environment variables into module-level constants
+import this module first, so they see .env values regardless of the
+order in which an entry point imports them.
+"""
+
+from dotenv import load_dotenv
+
+load_dotenv()
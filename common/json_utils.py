@@ -0,0 +1,41 @@
+"""JSON helpers for Orbit agents, backed by orjson when it is installed."""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to stdlib json
+    orjson = None
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so one type covers both
+JSONDecodeError = json.JSONDecodeError
+
+
+if orjson is not None:
+
+    def loads(data: str | bytes) -> Any:
+        """Parse a JSON document from str or bytes."""
+        return orjson.loads(data)
+
+    def dumps(obj: Any, indent: bool = False) -> str:
+        """Serialize obj to a JSON string, optionally with 2-space indentation."""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0).decode()
+
+    def dumpb(obj: Any) -> bytes:
+        """Serialize obj to compact UTF-8 JSON bytes, e.g. for a request body."""
+        return orjson.dumps(obj)
+
+else:
+
+    def loads(data: str | bytes) -> Any:
+        """Parse a JSON document from str or bytes."""
+        return json.loads(data)
+
+    def dumps(obj: Any, indent: bool = False) -> str:
+        """Serialize obj to a JSON string, optionally with 2-space indentation."""
+        return json.dumps(obj, indent=2 if indent else None)
+
+    def dumpb(obj: Any) -> bytes:
+        """Serialize obj to compact UTF-8 JSON bytes, e.g. for a request body."""
+        return json.dumps(obj, separators=(",", ":")).encode()
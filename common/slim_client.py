@@ -2,13 +2,17 @@
 
 import asyncio
 import logging
-from typing import Dict, Any
+import os
+from typing import Dict, Any, Optional, Tuple
 
 from agntcy_app_sdk.factory import GatewayFactory
 from a2a.types import SendMessageRequest, MessageSendParams, Message, TextPart, Role
 
 logger = logging.getLogger("orbit.slim_client")
 
+# Evict and re-create a cached client after this many consecutive failures
+MAX_CONSECUTIVE_FAILURES = 3
+
 
 class SlimClient:
     """Helper class for making SLIM-based A2A calls to other agents."""
@@ -16,6 +20,8 @@ class SlimClient:
     def __init__(self):
         self.factory = GatewayFactory()
         self._clients = {}  # Cache clients by agent_url
+        self._failures: Dict[str, int] = {}  # Consecutive failures per cached client
+        self._lock = asyncio.Lock()  # Guards first-time client creation
     
     def _convert_jsonrpc_to_a2a(self, jsonrpc_request: Dict[str, Any]) -> SendMessageRequest:
         """Convert JSON-RPC request to A2A SendMessageRequest format."""
@@ -29,11 +35,12 @@ class SlimClient:
                 text_part = TextPart(text=part.get("text", ""))
                 parts.append(text_part)
         
-        # Create Message object
+        # Create Message object; structured metadata is passed through as-is
         message = Message(
             messageId=message_data.get("messageId", "unknown"),
             role=Role.user,  # Default to user role
-            parts=parts
+            parts=parts,
+            metadata=message_data.get("metadata")
         )
         
         # Create MessageSendParams
@@ -47,6 +54,44 @@ class SlimClient:
         
         return request
     
+    def _resolve_agent(self, agent_url: str) -> Tuple[str, str, str]:
+        """Resolve an agent URL to its client cache key, SLIM endpoint and HTTP discovery URL."""
+        # Get central SLIM server endpoint (lungo pattern)
+        slim_endpoint = os.getenv('SLIM_ENDPOINT', 'slim://slim:46357')
+        
+        # Convert slim:// agent URL to HTTP for agent discovery
+        if agent_url.startswith('slim://'):
+            # Extract agent name and convert to HTTP endpoint
+            agent_name = agent_url.replace('slim://', '')
+            # Map to HTTP endpoint for agent discovery
+            http_agent_url = f"http://{agent_name}:9002"  # Default port, should be mapped per agent
+            if 'sentiment-analyst' in agent_name:
+                http_agent_url = f"http://{agent_name}:9002"
+            elif 'fact-checker' in agent_name:
+                http_agent_url = f"http://{agent_name}:9004"
+            elif 'risk-score' in agent_name:
+                http_agent_url = f"http://{agent_name}:9003"
+            elif 'legal-counsel' in agent_name:
+                http_agent_url = f"http://{agent_name}:9005"
+            elif 'press-secretary' in agent_name:
+                http_agent_url = f"http://{agent_name}:9006"
+            elif 'ear-to-ground' in agent_name:
+                http_agent_url = f"http://{agent_name}:9001"
+        else:
+            http_agent_url = agent_url
+        
+        return f"{slim_endpoint}:{http_agent_url}", slim_endpoint, http_agent_url
+    
+    async def warm_up(self, agent_url: str) -> None:
+        """Create the cached client for an agent ahead of its first call.
+        
+        Failures are only logged; the next call_agent retries the connection.
+        """
+        try:
+            await self._get_client(*self._resolve_agent(agent_url))
+        except Exception as e:
+            logger.warning("Could not warm up SLIM client for %s: %s", agent_url, e)
+    
     async def call_agent(self, agent_url: str, jsonrpc_request: Dict[str, Any], timeout: float = 30.0) -> Dict[str, Any]:
         """
         Call another agent using SLIM transport through central server.
@@ -62,53 +107,22 @@ class SlimClient:
         Raises:
             Exception: If the call fails or times out
         """
+        cache_key = None
         try:
-            # Get central SLIM server endpoint (lungo pattern)
-            import os
-            slim_endpoint = os.getenv('SLIM_ENDPOINT', 'slim://slim:46357')
-            
-            # Convert slim:// agent URL to HTTP for agent discovery
-            if agent_url.startswith('slim://'):
-                # Extract agent name and convert to HTTP endpoint
-                agent_name = agent_url.replace('slim://', '')
-                # Map to HTTP endpoint for agent discovery
-                http_agent_url = f"http://{agent_name}:9002"  # Default port, should be mapped per agent
-                if 'sentiment-analyst' in agent_name:
-                    http_agent_url = f"http://{agent_name}:9002"
-                elif 'fact-checker' in agent_name:
-                    http_agent_url = f"http://{agent_name}:9004"
-                elif 'risk-score' in agent_name:
-                    http_agent_url = f"http://{agent_name}:9003"
-                elif 'legal-counsel' in agent_name:
-                    http_agent_url = f"http://{agent_name}:9005"
-                elif 'press-secretary' in agent_name:
-                    http_agent_url = f"http://{agent_name}:9006"
-                elif 'ear-to-ground' in agent_name:
-                    http_agent_url = f"http://{agent_name}:9001"
-            else:
-                http_agent_url = agent_url
-            
-            # Create client if not cached (all go through central server)
-            cache_key = f"{slim_endpoint}:{http_agent_url}"
-            if cache_key not in self._clients:
-                transport = self.factory.create_transport("SLIM", endpoint=slim_endpoint)
-                client = await self.factory.create_client("A2A", agent_url=http_agent_url, transport=transport)
-                self._clients[cache_key] = client
-                logger.debug(f"Created new SLIM client for {http_agent_url} via {slim_endpoint}")
-            
-            client = self._clients[cache_key]
-            
             # Convert JSON-RPC to A2A format
             a2a_request = self._convert_jsonrpc_to_a2a(jsonrpc_request)
+            cache_key, slim_endpoint, http_agent_url = self._resolve_agent(agent_url)
             
-            # Make the call with timeout
-            logger.debug(f"Calling {agent_url} via central SLIM server with request: {jsonrpc_request}")
-            result = await asyncio.wait_for(
-                client.send_message(a2a_request),
-                timeout=timeout
-            )
+            # One deadline covers connecting a new client and the call itself,
+            # so callers need no outer timeout of their own
+            async with asyncio.timeout(timeout):
+                # Reuse the cached client (all go through central server)
+                client = await self._get_client(cache_key, slim_endpoint, http_agent_url)
+                
+                logger.debug("Calling %s via central SLIM server with request: %s", agent_url, jsonrpc_request)
+                result = await client.send_message(a2a_request)
             
-            logger.debug(f"Response from {agent_url}: {result}")
+            logger.debug("Response from %s: %s", agent_url, result)
             
             # Convert A2A response back to JSON-RPC format
             if hasattr(result, 'root') and result.root and hasattr(result.root, 'result'):
@@ -142,9 +156,11 @@ class SlimClient:
                         if key not in ['name'] and isinstance(value, dict):
                             response_data["result"].update(value)
                 
+                self._failures.pop(cache_key, None)
                 return response_data
             else:
-                # Handle error case
+                # Handle error case; an empty reply counts against the client too
+                await self._record_failure(cache_key)
                 return {
                     "id": jsonrpc_request.get("id"),
                     "jsonrpc": "2.0", 
@@ -152,21 +168,61 @@ class SlimClient:
                 }
             
         except asyncio.TimeoutError:
-            logger.error(f"SLIM call to {agent_url} timed out after {timeout}s")
+            logger.error("SLIM call to %s timed out after %ss", agent_url, timeout)
+            await self._record_failure(cache_key)
             return {"error": "Request timed out"}
         except Exception as e:
-            logger.error(f"Error calling {agent_url} via SLIM: {e}")
+            logger.error("Error calling %s via SLIM: %s", agent_url, e)
+            await self._record_failure(cache_key)
             return {"error": str(e)}
     
+    async def _get_client(self, cache_key: str, slim_endpoint: str, http_agent_url: str):
+        """Get the cached client for an agent, creating it on first use."""
+        client = self._clients.get(cache_key)
+        if client is not None:
+            return client
+            
+        async with self._lock:
+            # Another caller may have created it while we waited
+            if cache_key not in self._clients:
+                transport = self.factory.create_transport("SLIM", endpoint=slim_endpoint)
+                client = await self.factory.create_client("A2A", agent_url=http_agent_url, transport=transport)
+                self._clients[cache_key] = client
+                logger.debug("Created new SLIM client for %s via %s", http_agent_url, slim_endpoint)
+            return self._clients[cache_key]
+    
+    async def _record_failure(self, cache_key: Optional[str]) -> None:
+        """Count a failed call and evict the cached client once it looks unhealthy."""
+        if cache_key is None or cache_key not in self._clients:
+            return
+            
+        failures = self._failures.get(cache_key, 0) + 1
+        if failures < MAX_CONSECUTIVE_FAILURES:
+            self._failures[cache_key] = failures
+            return
+            
+        logger.warning("Evicting SLIM client %s after %d consecutive failures", cache_key, failures)
+        self._failures.pop(cache_key, None)
+        client = self._clients.pop(cache_key)
+        try:
+            if hasattr(client, 'close'):
+                await client.close()
+        except Exception as e:
+            logger.warning("Error closing client for %s: %s", cache_key, e)
+    
     async def close(self):
         """Close all cached clients."""
-        for agent_url, client in self._clients.items():
+        # Detach the cache first: the awaits below let other calls insert or
+        # evict clients, which would break iteration over the live dict
+        clients = list(self._clients.items())
+        self._clients.clear()
+        self._failures.clear()
+        for agent_url, client in clients:
             try:
                 if hasattr(client, 'close'):
                     await client.close()
             except Exception as e:
-                logger.warning(f"Error closing client for {agent_url}: {e}")
-        self._clients.clear()
+                logger.warning("Error closing client for %s: %s", agent_url, e)
 
 
 # Global client instance for reuse
@@ -2,6 +2,7 @@
 
 import asyncio
 import logging
+from contextlib import asynccontextmanager
 from datetime import datetime
 from typing import Dict, Any, Optional
 from fastapi import FastAPI, HTTPException
@@ -12,11 +13,37 @@ import httpx
 import os
 from pathlib import Path
 
+from common import json_utils
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("orbit.gateway")
 
-app = FastAPI(title="Orbit Crisis Management Gateway", version="1.0.0")
+# Shared HTTP client; keeps connections to Ear-to-Ground alive across polls
+_http_client: Optional[httpx.AsyncClient] = None
+
+def get_http_client() -> httpx.AsyncClient:
+    """Get the shared HTTP client, creating it on first use."""
+    global _http_client
+    if _http_client is None:
+        _http_client = httpx.AsyncClient(
+            # Every request is a JSON-RPC body; set the header once, not per call
+            headers={"Content-Type": "application/json"},
+            timeout=10.0,
+            limits=httpx.Limits(max_connections=16, max_keepalive_connections=8)
+        )
+    return _http_client
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Close the shared HTTP client on shutdown."""
+    yield
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+app = FastAPI(title="Orbit Crisis Management Gateway", version="1.0.0", lifespan=lifespan)
 
 # Enable CORS for React frontend (both dev and prod)
 app.add_middleware(
@@ -29,6 +56,37 @@ app.add_middleware(
 
 # Ear-to-Ground agent endpoint (acts as orchestrator)
 EAR_TO_GROUND_ENDPOINT = os.getenv("EAR_TO_GROUND_URL", "http://localhost:9001")
+EAR_TO_GROUND_RPC_URL = f"{EAR_TO_GROUND_ENDPOINT}/"
+
+# Pre-encoded A2A JSON-RPC envelope; only the message id and text vary per request
+_RPC_TEMPLATE = json_utils.dumpb({
+    "jsonrpc": "2.0",
+    "method": "message/send",
+    "params": {
+        "message": {
+            "messageId": "__MESSAGE_ID__",
+            "role": "user",
+            "parts": [{"type": "text", "text": "__TEXT__"}]
+        }
+    },
+    "id": 1
+})
+_RPC_PREFIX, _rpc_rest = _RPC_TEMPLATE.split(b'"__MESSAGE_ID__"', 1)
+_RPC_MIDDLE, _RPC_SUFFIX = _rpc_rest.split(b'"__TEXT__"', 1)
+
+def build_rpc_body(message_id: str, text: str) -> bytes:
+    """Build a message/send request body by splicing JSON-escaped values into the envelope."""
+    return b"".join((_RPC_PREFIX, json_utils.dumpb(message_id), _RPC_MIDDLE, json_utils.dumpb(text), _RPC_SUFFIX))
+
+# Responses at least this large are parsed in a worker thread to keep the event loop free
+THREADED_DECODE_THRESHOLD = 64 * 1024
+
+async def decode_json_response(response: httpx.Response) -> Any:
+    """Parse a JSON response body, offloading large bodies to a worker thread."""
+    content = response.content
+    if len(content) >= THREADED_DECODE_THRESHOLD:
+        return await asyncio.to_thread(json_utils.loads, content)
+    return json_utils.loads(content)
 
 # In-memory crisis state
 class CrisisState:
@@ -111,39 +169,25 @@ async def call_ear_to_ground_agent(tweet_content: str) -> Optional[Dict[str, Any
     """Call Ear-to-Ground agent to start crisis orchestration."""
     try:
         # Prepare A2A JSON-RPC request to trigger crisis workflow
-        request_payload = {
-            "jsonrpc": "2.0",
-            "method": "message/send",
-            "params": {
-                "message": {
-                    "messageId": f"trigger-{crisis_state.crisis_id}",
-                    "role": "user",
-                    "parts": [
-                        {
-                            "type": "text",
-                            "text": f"Start streaming crisis tweets with content: {tweet_content}"
-                        }
-                    ]
-                }
-            },
-            "id": 1
-        }
+        request_body = build_rpc_body(
+            f"trigger-{crisis_state.crisis_id}",
+            f"Start streaming crisis tweets with content: {tweet_content}"
+        )
         
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.post(
-                f"{EAR_TO_GROUND_ENDPOINT}/",
-                json=request_payload,
-                headers={"Content-Type": "application/json"}
-            )
+        client = get_http_client()
+        response = await client.post(
+            EAR_TO_GROUND_RPC_URL,
+            content=request_body
+        )
             
-            if response.status_code == 200:
-                result = response.json()
-                logger.info("Ear-to-Ground agent called successfully")
-                return result
-            else:
-                error_text = await response.aread()
-                logger.error(f"Ear-to-Ground call failed: {response.status_code} - {error_text}")
-                return {"error": f"HTTP {response.status_code}: {error_text}"}
+        if response.status_code == 200:
+            result = await decode_json_response(response)
+            logger.info("Ear-to-Ground agent called successfully")
+            return result
+        else:
+            error_text = await response.aread()
+            logger.error(f"Ear-to-Ground call failed: {response.status_code} - {error_text}")
+            return {"error": f"HTTP {response.status_code}: {error_text}"}
                 
     except httpx.TimeoutException:
         logger.error("Ear-to-Ground agent call timed out")
@@ -201,82 +245,68 @@ async def get_crisis_results_from_ear_to_ground() -> Optional[Dict[str, Any]]:
     """Get final crisis results from Ear-to-Ground orchestration."""
     try:
         # Query Ear-to-Ground for status/results including final crisis response
-        request_payload = {
-            "jsonrpc": "2.0",
-            "method": "message/send",
-            "params": {
-                "message": {
-                    "messageId": f"status-{crisis_state.crisis_id}",
-                    "role": "user",
-                    "parts": [
-                        {
-                            "type": "text",
-                            "text": "Provide status and final results"  # This will trigger final response inclusion
-                        }
-                    ]
-                }
-            },
-            "id": 1
-        }
+        request_body = build_rpc_body(
+            f"status-{crisis_state.crisis_id}",
+            "Provide status and final results"  # This will trigger final response inclusion
+        )
         
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.post(
-                f"{EAR_TO_GROUND_ENDPOINT}/",
-                json=request_payload,
-                headers={"Content-Type": "application/json"}
-            )
+        client = get_http_client()
+        response = await client.post(
+            EAR_TO_GROUND_RPC_URL,
+            content=request_body
+        )
             
-            if response.status_code == 200:
-                result = response.json()
+        if response.status_code == 200:
+            result = await decode_json_response(response)
                 
-                # Try to extract the final crisis response and progress from Ear-to-Ground metadata
-                final_crisis_response = None
-                progress_data = None
-                partial_results_data = None
+            # Try to extract the final crisis response and progress from Ear-to-Ground metadata
+            final_crisis_response = None
+            progress_data = None
+            partial_results_data = None
                 
-                if isinstance(result, dict) and "result" in result:
-                    result_data = result["result"]
-                    if isinstance(result_data, dict) and "metadata" in result_data:
-                        metadata = result_data["metadata"]
-                        if isinstance(metadata, dict):
-                            # Extract final crisis response
-                            if "final_crisis_response" in metadata:
-                                final_crisis_response = metadata["final_crisis_response"]
-                                logger.info("Extracted final crisis response from Ear-to-Ground")
+            if isinstance(result, dict) and "result" in result:
+                result_data = result["result"]
+                if isinstance(result_data, dict) and "metadata" in result_data:
+                    metadata = result_data["metadata"]
+                    if isinstance(metadata, dict):
+                        # Extract final crisis response
+                        if "final_crisis_response" in metadata:
+                            final_crisis_response = metadata["final_crisis_response"]
+                            logger.info("Extracted final crisis response from Ear-to-Ground")
                             
-                            # Extract progress and partial results
-                            if "progress" in metadata:
-                                progress_data = metadata["progress"]
-                                logger.debug("Extracted agent progress from Ear-to-Ground")
+                        # Extract progress and partial results
+                        if "progress" in metadata:
+                            progress_data = metadata["progress"]
+                            logger.debug("Extracted agent progress from Ear-to-Ground")
                             
-                            if "partial_results" in metadata:
-                                partial_results_data = metadata["partial_results"]
-                                logger.debug("Extracted partial results from Ear-to-Ground")
+                        if "partial_results" in metadata:
+                            partial_results_data = metadata["partial_results"]
+                            logger.debug("Extracted partial results from Ear-to-Ground")
                  
-                # Only proceed with extraction if we actually have final crisis response data
-                # Always return progress and partial results, even if final response isn't ready
-                result_data = {}
+            # Only proceed with extraction if we actually have final crisis response data
+            # Always return progress and partial results, even if final response isn't ready
+            result_data = {}
                 
-                if progress_data:
-                    result_data["progress"] = progress_data
+            if progress_data:
+                result_data["progress"] = progress_data
                 
-                if partial_results_data:
-                    result_data["partial_results"] = partial_results_data
+            if partial_results_data:
+                result_data["partial_results"] = partial_results_data
                 
-                # If we have a final crisis response, extract the Press Secretary data
-                if final_crisis_response:
-                    press_secretary_data = extract_press_secretary_response(final_crisis_response)
-                    if press_secretary_data:
-                        logger.info("✅ Crisis response complete - Press Secretary data ready")
-                        result_data["press_secretary_response"] = press_secretary_data
-                    else:
-                        logger.warning("Press Secretary data not found in final response")
+            # If we have a final crisis response, extract the Press Secretary data
+            if final_crisis_response:
+                press_secretary_data = extract_press_secretary_response(final_crisis_response)
+                if press_secretary_data:
+                    logger.info("✅ Crisis response complete - Press Secretary data ready")
+                    result_data["press_secretary_response"] = press_secretary_data
+                else:
+                    logger.warning("Press Secretary data not found in final response")
                 
-                # Return progress/partial results even if final response isn't ready
-                return result_data if result_data else None
-            else:
-                logger.error(f"Failed to get results from Ear-to-Ground: {response.status_code}")
-                return None
+            # Return progress/partial results even if final response isn't ready
+            return result_data if result_data else None
+        else:
+            logger.error(f"Failed to get results from Ear-to-Ground: {response.status_code}")
+            return None
                 
     except Exception as e:
         logger.error(f"Error getting crisis results: {e}")